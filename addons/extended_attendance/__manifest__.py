@@ -17,7 +17,11 @@ Features:
 * Location-based attendance tracking
 * Extended person profiles with custom fields
 * REST API for external integrations
+* Live presence and occupancy updates over the Odoo bus
 * Comprehensive reporting and analytics
+* Daily attendance summaries refreshed incrementally for long-range trends
+* Occupancy history per location with automatic downsampling
+* Archiving of old attendance records, still included in reports
 
 Use Cases:
 ----------
@@ -33,16 +37,25 @@ HTTP API Endpoints:
 * Persons: Unified person management
 * Attendance: Location-aware attendance tracking
     """,
-    'depends': ['hr_attendance', 'hr', 'base'],
+    'depends': ['hr_attendance', 'hr', 'base', 'bus'],
     'data': [
         'security/ir.model.access.csv',
         'security/security.xml',
         'data/person_types_data.xml',
+        'data/attendance_daily_cron.xml',
+        'data/occupancy_sample_cron.xml',
+        'data/overtime_recompute_cron.xml',
+        'data/hr_attendance_sync_cron.xml',
+        'data/person_thumbnail_cron.xml',
+        'data/attendance_archive_cron.xml',
 
         'views/person_type_views.xml',
         'views/attendance_location_views.xml',
         'views/extended_person_views.xml',
         'views/extended_attendance_views.xml',
+        'views/attendance_daily_views.xml',
+        'views/attendance_archive_views.xml',
+        'views/occupancy_sample_views.xml',
         'views/menu_views.xml',
     ],
     'demo': [
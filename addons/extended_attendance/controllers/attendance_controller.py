@@ -1,18 +1,93 @@
-from odoo import http
+from odoo import http, fields
+from odoo.api import call_kw
 from odoo.http import request
+from odoo.models import check_method_name
+from werkzeug.http import http_date, quote_etag
+from datetime import timedelta
+import base64
 import json
+import time
+
+from .serializers import compress, dumps, serialize_rows
+
+
+# Fields that may be requested from /api/attendance/records
+RECORD_FIELDS = [
+    'id', 'person_id', 'person_name', 'location_id', 'location_name', 'person_type_id',
+    'check_in', 'check_out', 'worked_hours', 'duration_hours', 'state', 'auto_action', 'is_overtime', 'notes',
+]
+DEFAULT_RECORD_FIELDS = [
+    'id', 'person_id', 'person_name', 'location_id', 'location_name', 'check_in', 'check_out',
+    'worked_hours', 'state',
+]
+RECORD_MANY2ONE_FIELDS = ['person_id', 'location_id', 'person_type_id']
+REPORT_RECORD_FIELDS = [
+    'id', 'person_name', 'person_type_id', 'location_name', 'check_in', 'check_out', 'worked_hours', 'state',
+]
+RECORDS_DEFAULT_LIMIT = 100
+RECORDS_MAX_LIMIT = 1000
+
+PERSON_TYPE_FIELDS = ['id', 'name', 'code', 'description', 'default_access_level', 'active']
+LOCATION_FIELDS = ['id', 'name', 'code', 'capacity', 'current_occupancy', 'building', 'floor', 'active']
+
+# Seconds a worker reuses its last dashboard payload, per database
+DASHBOARD_CACHE_TTL = 10
+_dashboard_cache = {}
 
 
 class AttendanceController(http.Controller):
     """Simple HTTP API controller for Extended Attendance module"""
 
-    def _json_response(self, data):
-        """Helper method to return JSON response"""
+    def _json_response(self, data, headers=None):
+        """Helper method to return JSON response, gzipped if the client accepts it"""
+        body, encoding_headers = compress(dumps(data), request.httprequest.headers.get('Accept-Encoding'))
         return request.make_response(
-            json.dumps(data),
-            headers=[('Content-Type', 'application/json')]
+            body,
+            headers=[('Content-Type', 'application/json')] + encoding_headers + (headers or [])
         )
 
+    def _get_version(self, model_names):
+        """Return a cheap (etag, last_modified) version of the given models.
+
+        The version is built from the row count and latest ``write_date`` of
+        each model's table, so it changes on any create, write or delete.
+        """
+        tokens = []
+        last_modified = None
+        for model_name in model_names:
+            model = request.env[model_name].sudo()
+            model.flush_model()
+            request.env.cr.execute(f'SELECT count(*), max(write_date) FROM "{model._table}"')
+            count, write_date = request.env.cr.fetchone()
+            tokens.append(f"{count}-{write_date.timestamp() if write_date else 0}")
+            if write_date and (not last_modified or write_date > last_modified):
+                last_modified = write_date
+        return '.'.join(tokens), last_modified
+
+    def _cache_headers(self, etag, last_modified):
+        """Return validator headers so clients can revalidate cheaply"""
+        headers = [('ETag', quote_etag(etag)), ('Cache-Control', 'no-cache')]
+        if last_modified:
+            headers.append(('Last-Modified', http_date(last_modified)))
+        return headers
+
+    def _not_modified_response(self, etag, last_modified):
+        """Return a 304 response if the client already has this version"""
+        httprequest = request.httprequest
+        if httprequest.if_none_match:
+            not_modified = httprequest.if_none_match.contains(etag)
+        elif httprequest.if_modified_since and last_modified:
+            not_modified = last_modified.replace(microsecond=0) <= httprequest.if_modified_since.replace(tzinfo=None)
+        else:
+            not_modified = False
+
+        if not_modified:
+            # The ETag is shared by the gzipped and plain bodies, so the 304
+            # varies on Accept-Encoding like the 200 it revalidates
+            headers = self._cache_headers(etag, last_modified) + [('Vary', 'Accept-Encoding')]
+            return request.make_response('', headers=headers, status=304)
+        return None
+
     @http.route('/api/person-types', type='http', auth='public', methods=['GET'], csrf=False)
     def get_person_types(self, **kwargs):
         """Get all person types (legacy endpoint)"""
@@ -22,32 +97,40 @@ class AttendanceController(http.Controller):
     def get_attendance_person_types(self, **kwargs):
         """Get all person types"""
         try:
-            person_types = request.env['person.type'].sudo().search([])
-            data = []
+            etag, last_modified = self._get_version(['person.type', 'extended.attendance.person'])
+            not_modified = self._not_modified_response(etag, last_modified)
+            if not_modified:
+                return not_modified
 
-            for person_type in person_types:
-                # Count persons of this type
-                person_count = request.env['extended.attendance.person'].sudo().search_count([
-                    ('person_type_id', '=', person_type.id)
-                ])
+            person_types = request.env['person.type'].sudo().search_read([], PERSON_TYPE_FIELDS)
+
+            # Count persons of every type in a single grouped query
+            person_counts = {
+                person_type.id: count
+                for person_type, count in request.env['extended.attendance.person'].sudo()._read_group(
+                    [], ['person_type_id'], ['__count']
+                )
+            }
 
+            data = []
+            for person_type in person_types:
                 data.append({
-                    'id': person_type.id,
-                    'name': person_type.name,
-                    'code': person_type.code,
-                    'description': person_type.description or '',
-                    'access_level': person_type.access_level,
-                    'default_access_level': person_type.access_level,
-                    'active': person_type.active,
-                    'is_system': person_type.code in ['ADMIN', 'OWNER'],
-                    'person_count': person_count
+                    'id': person_type['id'],
+                    'name': person_type['name'],
+                    'code': person_type['code'],
+                    'description': person_type['description'] or '',
+                    'access_level': person_type['default_access_level'],
+                    'default_access_level': person_type['default_access_level'],
+                    'active': person_type['active'],
+                    'is_system': person_type['code'] in ['ADMIN', 'OWNER'],
+                    'person_count': person_counts.get(person_type['id'], 0)
                 })
 
             return self._json_response({
                 'success': True,
                 'data': data,
                 'count': len(data)
-            })
+            }, headers=self._cache_headers(etag, last_modified))
 
         except Exception as e:
             return self._json_response({
@@ -64,26 +147,24 @@ class AttendanceController(http.Controller):
     def get_attendance_locations(self, **kwargs):
         """Get all locations"""
         try:
-            locations = request.env['attendance.location'].sudo().search([('active', '=', True)])
-            data = []
-
-            for location in locations:
-                data.append({
-                    'id': location.id,
-                    'name': location.name,
-                    'code': location.code,
-                    'capacity': location.capacity,
-                    'current_occupancy': location.current_occupancy,
-                    'building': location.building or '',
-                    'floor': location.floor or '',
-                    'active': location.active
-                })
+            etag, last_modified = self._get_version(['attendance.location'])
+            not_modified = self._not_modified_response(etag, last_modified)
+            if not_modified:
+                return not_modified
+
+            locations = request.env['attendance.location'].sudo().search_read(
+                [('active', '=', True)], LOCATION_FIELDS
+            )
+            data = serialize_rows(locations, LOCATION_FIELDS)
+            for location in data:
+                location['building'] = location['building'] or ''
+                location['floor'] = location['floor'] or ''
 
             return self._json_response({
                 'success': True,
                 'data': data,
                 'count': len(data)
-            })
+            }, headers=self._cache_headers(etag, last_modified))
 
         except Exception as e:
             return self._json_response({
@@ -93,43 +174,76 @@ class AttendanceController(http.Controller):
 
 
 
-    @http.route('/api/attendance/persons', type='http', auth='public', methods=['GET'], csrf=False)
-    def get_attendance_persons(self, **kwargs):
-        """Get all extended persons"""
+    @http.route('/api/attendance/locations/tree', type='http', auth='public', methods=['GET'], csrf=False)
+    def get_attendance_location_tree(self, **kwargs):
+        """Get active locations as a nested tree"""
         try:
-            persons = request.env['extended.attendance.person'].sudo().search([])
-            data = []
+            etag, last_modified = self._get_version(['attendance.location'])
+            not_modified = self._not_modified_response(etag, last_modified)
+            if not_modified:
+                return not_modified
 
-            for person in persons:
-                # Check if person is currently checked in
-                current_attendance = request.env['extended.attendance'].sudo().search([
-                    ('person_id', '=', person.id),
-                    ('state', '=', 'checked_in')
-                ], limit=1)
+            data = request.env['attendance.location'].sudo().get_location_tree()
 
-                is_checked_in = bool(current_attendance)
-                current_location = None
-                if current_attendance and current_attendance.location_id:
-                    current_location = {
-                        'name': current_attendance.location_id.name,
-                        'code': current_attendance.location_id.code
-                    }
+            return self._json_response({
+                'success': True,
+                'data': data,
+                'count': len(data)
+            }, headers=self._cache_headers(etag, last_modified))
 
-                data.append({
-                    'id': person.id,
-                    'name': person.name,
-                    'person_id': person.person_id,
-                    'person_type': {
-                        'name': person.person_type_id.name if person.person_type_id else '',
-                        'code': person.person_type_id.code if person.person_type_id else ''
-                    },
-                    'is_checked_in': is_checked_in,
-                    'current_location': current_location,
-                    'email': person.email or '',
-                    'phone': person.phone or '',
-                    'active': person.active
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/locations/import', type='http', auth='user', methods=['POST'], csrf=False)
+    def import_attendance_locations(self, **kwargs):
+        """Create or update a location hierarchy in bulk.
+
+        JSON body: ``locations``, a list of nested (``children``) or
+        adjacency-list (``parent_code``) location dicts, and optional
+        ``update_existing`` (default true). Restricted to attendance managers.
+        """
+        try:
+            data = json.loads(request.httprequest.data.decode('utf-8'))
+            if not data.get('locations'):
+                return self._json_response({
+                    'success': False,
+                    'error': 'locations is required'
                 })
 
+            result = request.env['attendance.location'].import_location_tree(
+                data['locations'], update_existing=data.get('update_existing', True)
+            )
+
+            return self._json_response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/persons', type='http', auth='public', methods=['GET'], csrf=False)
+    def get_attendance_persons(self, **kwargs):
+        """Get all extended persons.
+
+        Optional query parameters: ``custom_filter``, a JSON object of custom
+        field values the persons must have, and ``custom_fields``, a comma
+        separated list of custom fields to include in each row.
+        """
+        try:
+            domain = []
+            if kwargs.get('custom_filter'):
+                domain.append(('custom_field_filter', '=', json.loads(kwargs['custom_filter'])))
+            custom_fields = kwargs['custom_fields'].split(',') if kwargs.get('custom_fields') else None
+
+            data = request.env['extended.attendance.person'].sudo().get_directory(domain, custom_fields)
+
             return self._json_response({
                 'success': True,
                 'data': data,
@@ -142,6 +256,95 @@ class AttendanceController(http.Controller):
                 'error': str(e)
             })
 
+    @http.route('/api/attendance/persons/import', type='http', auth='user', methods=['POST'], csrf=False)
+    def import_attendance_persons(self, **kwargs):
+        """Create or update persons in bulk from a CSV or NDJSON body.
+
+        The format is taken from the ``format`` query parameter (``csv`` or
+        ``ndjson``), else from the Content-Type. Existing persons, matched on
+        their person ID, are updated unless ``update_existing=0``. The
+        response holds the created and updated counts and one error per
+        rejected line.
+        """
+        try:
+            file_format = kwargs.get('format')
+            if not file_format:
+                content_type = request.httprequest.mimetype
+                file_format = 'ndjson' if content_type in ('application/x-ndjson', 'application/jsonl') else 'csv'
+
+            result = request.env['extended.attendance.person'].import_persons(
+                request.httprequest.get_data(as_text=True),
+                file_format=file_format,
+                update_existing=kwargs.get('update_existing') not in ('0', 'false'),
+            )
+
+            return self._json_response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/persons/<int:person_id>/thumbnail/<int:size>', type='http', auth='public',
+                methods=['GET'], csrf=False)
+    def get_person_thumbnail(self, person_id, size, **kwargs):
+        """Get a person's photo thumbnail (64, 128 or 256 pixels).
+
+        Thumbnails are stored in the background (and resized in memory until
+        then) and identified by the photo checksum, so they are revalidated
+        with a strong ETag and may be cached forever when requested with the
+        versioned ``thumbnail_url``.
+        """
+        try:
+            person = request.env['extended.attendance.person'].sudo().browse(person_id).exists()
+            checksum = person and person._get_image_checksums().get(person.id)
+            if not checksum:
+                return request.make_response('', status=404)
+
+            etag = f'{checksum}-{size}'
+            headers = [('ETag', quote_etag(etag))]
+            headers.append(('Cache-Control', 'public, max-age=31536000, immutable' if kwargs.get('v') else 'no-cache'))
+            if request.httprequest.if_none_match.contains(etag):
+                return request.make_response('', headers=headers, status=304)
+
+            thumbnail = person.get_thumbnail(size)
+            return request.make_response(
+                base64.b64decode(thumbnail['datas']),
+                headers=[('Content-Type', thumbnail['mimetype'])] + headers
+            )
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/dashboard', type='http', auth='public', methods=['GET'], csrf=False)
+    def get_attendance_dashboard(self, **kwargs):
+        """Get dashboard KPIs (totals, occupancy, per-type and daily counts)"""
+        try:
+            # Days are counted in the caller's timezone
+            cache_key = (request.env.cr.dbname, request.env.context.get('tz'))
+            expires_at, data = _dashboard_cache.get(cache_key, (0, None))
+            if expires_at < time.monotonic():
+                data = request.env['extended.attendance.record'].sudo().get_dashboard_data()
+                _dashboard_cache[cache_key] = (time.monotonic() + DASHBOARD_CACHE_TTL, data)
+
+            return self._json_response({
+                'success': True,
+                'data': data
+            }, headers=[('Cache-Control', f'max-age={DASHBOARD_CACHE_TTL}')])
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
     @http.route('/api/attendance/check-in', type='http', auth='public', methods=['POST'], csrf=False)
     def attendance_check_in(self, **kwargs):
         """Check in a person"""
@@ -199,6 +402,246 @@ class AttendanceController(http.Controller):
                 'error': str(e)
             })
 
+    def _encode_cursor(self, record):
+        """Encode the (check_in, id) keyset position of a record row"""
+        position = f"{fields.Datetime.to_string(record['check_in'])}|{record['id']}"
+        return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii')
+
+    def _decode_cursor(self, cursor):
+        """Decode a cursor produced by _encode_cursor into (check_in, id)"""
+        check_in, record_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|')
+        return fields.Datetime.to_datetime(check_in), int(record_id)
+
+    @http.route('/api/attendance/records', type='http', auth='public', methods=['GET'], csrf=False)
+    def get_attendance_records(self, **kwargs):
+        """Get attendance history, archived records included, newest first,
+        using keyset pagination.
+
+        Query parameters: ``person_id``/``person_identifier``, ``location_code``
+        (with its sub-locations unless ``include_children=0``),
+        ``person_type_code``, ``date_from``, ``date_to`` (a date without a time
+        includes that whole day), ``min_hours`` (duration,
+        counting ongoing visits up to now), ``fields`` (comma
+        separated), ``limit`` and ``cursor`` (the ``next_cursor`` of the
+        previous page).
+        """
+        try:
+            env = request.env
+            domain = []
+
+            if kwargs.get('person_id'):
+                domain.append(('person_id', '=', int(kwargs['person_id'])))
+            elif kwargs.get('person_identifier'):
+                person = env['extended.attendance.person'].sudo().search_by_identifier(kwargs['person_identifier'])
+                domain.append(('person_id', '=', person.id))
+
+            if kwargs.get('location_code'):
+                location = env['attendance.location'].sudo().search([
+                    ('code', '=', kwargs['location_code'])
+                ], limit=1)
+                operator = '=' if kwargs.get('include_children') in ('0', 'false') else 'child_of'
+                domain.append(('location_id', operator, location.id))
+
+            if kwargs.get('person_type_code'):
+                person_type = env['person.type'].sudo().search([
+                    ('code', '=', kwargs['person_type_code'])
+                ], limit=1)
+                domain.append(('person_type_id', '=', person_type.id))
+
+            if kwargs.get('date_from'):
+                domain.append(('check_in', '>=', fields.Datetime.to_datetime(kwargs['date_from'])))
+            if kwargs.get('date_to'):
+                date_to = fields.Datetime.to_datetime(kwargs['date_to'])
+                if len(kwargs['date_to']) <= 10:
+                    # A date includes the whole day
+                    domain.append(('check_in', '<', date_to + timedelta(days=1)))
+                else:
+                    domain.append(('check_in', '<=', date_to))
+            if kwargs.get('min_hours'):
+                domain.append(('duration_hours', '>=', float(kwargs['min_hours'])))
+
+            # Keyset pagination: continue strictly after the last (check_in, id) seen.
+            # The ANDed check_in <= cursor leaf gives the (check_in, id) index a
+            # range bound, so deep pages don't scan from the newest row
+            if kwargs.get('cursor'):
+                check_in, record_id = self._decode_cursor(kwargs['cursor'])
+                domain += [
+                    ('check_in', '<=', check_in),
+                    '|', ('check_in', '<', check_in),
+                    '&', ('check_in', '=', check_in), ('id', '<', record_id),
+                ]
+
+            field_names = DEFAULT_RECORD_FIELDS
+            if kwargs.get('fields'):
+                field_names = [name for name in kwargs['fields'].split(',') if name in RECORD_FIELDS]
+            read_fields = list(set(field_names) | {'check_in'})
+
+            limit = max(1, min(int(kwargs.get('limit') or RECORDS_DEFAULT_LIMIT), RECORDS_MAX_LIMIT))
+            # Archived records share the id sequence, so one cursor pages through both
+            records = []
+            for model_name in ('extended.attendance.record', 'extended.attendance.record.archive'):
+                records += env[model_name].sudo().search_read(
+                    domain, read_fields, order='check_in desc, id desc', limit=limit + 1
+                )
+            records.sort(key=lambda record: (record['check_in'], record['id']), reverse=True)
+
+            has_more = len(records) > limit
+            records = records[:limit]
+
+            data = serialize_rows(records, field_names, RECORD_MANY2ONE_FIELDS)
+
+            return self._json_response({
+                'success': True,
+                'data': data,
+                'count': len(data),
+                'next_cursor': self._encode_cursor(records[-1]) if has_more else None
+            })
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/report', type='http', auth='public', methods=['POST'], csrf=False)
+    def attendance_report(self, **kwargs):
+        """Get aggregated attendance statistics for a date range.
+
+        JSON body: ``date_from``, ``date_to``, optional ``location_code``,
+        ``person_type_code``, ``group_by`` (day, week, month, location,
+        person_type or person) and ``limit``/``offset`` for the page of
+        detail records returned alongside the statistics.
+        """
+        try:
+            data = json.loads(request.httprequest.data.decode('utf-8'))
+            if not data.get('date_from') or not data.get('date_to'):
+                return self._json_response({
+                    'success': False,
+                    'error': 'date_from and date_to are required'
+                })
+
+            limit = max(1, min(int(data.get('limit') or RECORDS_DEFAULT_LIMIT), RECORDS_MAX_LIMIT))
+            offset = int(data.get('offset') or 0)
+            report = request.env['extended.attendance.record'].sudo().get_attendance_report(
+                data['date_from'], data['date_to'],
+                location_code=data.get('location_code'),
+                person_type_code=data.get('person_type_code'),
+                group_by=data.get('group_by'),
+                limit=limit,
+                offset=offset,
+            )
+
+            rows = report['records'].read(REPORT_RECORD_FIELDS) + report['archived_records'].read(REPORT_RECORD_FIELDS)
+            rows.sort(key=lambda row: (row['check_in'], row['id']), reverse=True)
+            records = serialize_rows(rows, REPORT_RECORD_FIELDS, RECORD_MANY2ONE_FIELDS)
+            for record, row in zip(records, rows):
+                record['person_type'] = row['person_type_id'][1] if row['person_type_id'] else ''
+
+            has_more = offset + limit < report['statistics']['total_records']
+            return self._json_response({
+                'success': True,
+                'data': {
+                    'records': records,
+                    'statistics': report['statistics'],
+                    'groups': report.get('groups', []),
+                    'next_offset': offset + limit if has_more else None
+                }
+            })
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/daily', type='http', auth='public', methods=['GET'], csrf=False)
+    def get_attendance_daily(self, **kwargs):
+        """Get visits, distinct persons and hours per day from the daily summaries.
+
+        Query parameters: ``date_from``, ``date_to`` (required),
+        ``location_code`` (including its sub-locations) and ``person_type_code``.
+        """
+        try:
+            if not kwargs.get('date_from') or not kwargs.get('date_to'):
+                return self._json_response({
+                    'success': False,
+                    'error': 'date_from and date_to are required'
+                })
+
+            data = request.env['extended.attendance.daily'].sudo().get_daily_trend(
+                kwargs['date_from'], kwargs['date_to'],
+                location_code=kwargs.get('location_code'),
+                person_type_code=kwargs.get('person_type_code'),
+            )
+
+            return self._json_response({
+                'success': True,
+                'data': data,
+                'count': len(data)
+            })
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/occupancy', type='http', auth='public', methods=['GET'], csrf=False)
+    def get_attendance_occupancy(self, **kwargs):
+        """Get average/peak occupancy and utilization per location over time.
+
+        Query parameters: ``date_from``, ``date_to`` (required),
+        ``location_code`` (including its sub-locations) and ``interval``
+        (hour, day, week or month; hour by default).
+        """
+        try:
+            if not kwargs.get('date_from') or not kwargs.get('date_to'):
+                return self._json_response({
+                    'success': False,
+                    'error': 'date_from and date_to are required'
+                })
+
+            data = request.env['attendance.occupancy.sample'].sudo().get_occupancy_series(
+                kwargs['date_from'], kwargs['date_to'],
+                location_code=kwargs.get('location_code'),
+                interval=kwargs.get('interval') or 'hour',
+            )
+
+            return self._json_response({
+                'success': True,
+                'data': data,
+                'count': len(data)
+            })
+
+        except Exception as e:
+            return self._json_response({
+                'success': False,
+                'error': str(e)
+            })
+
+    @http.route('/api/attendance/batch', type='json', auth='user', methods=['POST'], csrf=False)
+    def call_kw_batch(self, calls):
+        """Execute several model method calls in one request.
+
+        ``calls`` is a list of ``{model, method, args, kwargs}`` dicts, run in
+        order with the session user's environment. Each call runs in its own
+        savepoint, so a failing call is rolled back without affecting the
+        others. Returns one ``{result}`` or ``{error}`` dict per call, in the
+        same order.
+        """
+        results = []
+        for call in calls:
+            try:
+                check_method_name(call['method'])
+                with request.env.cr.savepoint():
+                    result = call_kw(
+                        request.env[call['model']], call['method'], call.get('args', []), call.get('kwargs', {})
+                    )
+                results.append({'result': result})
+            except Exception as e:
+                results.append({'error': str(e)})
+        return results
+
     @http.route('/api/status', type='http', auth='public', methods=['GET'], csrf=False)
     def api_status(self, **kwargs):
         """Simple API status endpoint"""
@@ -212,7 +655,17 @@ class AttendanceController(http.Controller):
                 'GET /api/locations',
                 'GET /api/attendance/person-types',
                 'GET /api/attendance/locations',
+                'GET /api/attendance/locations/tree',
+                'POST /api/attendance/locations/import',
                 'GET /api/attendance/persons',
-                'POST /api/attendance/check-in'
+                'POST /api/attendance/persons/import',
+                'GET /api/attendance/persons/<id>/thumbnail/<size>',
+                'GET /api/attendance/dashboard',
+                'GET /api/attendance/records',
+                'GET /api/attendance/daily',
+                'GET /api/attendance/occupancy',
+                'POST /api/attendance/check-in',
+                'POST /api/attendance/report',
+                'POST /api/attendance/batch'
             ]
         })
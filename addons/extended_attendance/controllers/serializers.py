@@ -0,0 +1,62 @@
+"""JSON serialization helpers shared by the Extended Attendance REST API"""
+
+from datetime import date
+import gzip
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Responses smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 5
+
+
+def _default(value):
+    """Encode values the stdlib encoder doesn't know about"""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps(data):
+    """Encode data as compact JSON bytes, using orjson when available.
+
+    Dates and datetimes are encoded as ISO 8601 strings by both backends.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default, separators=(',', ':')).encode('utf-8')
+
+
+def serialize_rows(rows, field_names, many2one_fields=()):
+    """Project ``search_read``/``read`` rows onto ``field_names``.
+
+    ``many2one_fields`` are flattened from ``(id, name)`` pairs to plain ids
+    and empty values to None; every other value is kept as read, leaving
+    date encoding to :func:`dumps`.
+    """
+    many2one_fields = set(many2one_fields)
+    data = []
+    for row in rows:
+        item = {}
+        for name in field_names:
+            value = row[name]
+            if name in many2one_fields:
+                value = value[0] if value else None
+            item[name] = value
+        data.append(item)
+    return data
+
+
+def compress(body, accept_encoding):
+    """Gzip ``body`` when the client accepts it and it is large enough.
+
+    Returns ``(body, headers)`` where ``headers`` holds the extra response
+    headers to send along with the (possibly compressed) body.
+    """
+    if len(body) < GZIP_MIN_SIZE or 'gzip' not in (accept_encoding or ''):
+        return body, [('Vary', 'Accept-Encoding')]
+    return gzip.compress(body, GZIP_LEVEL), [('Content-Encoding', 'gzip'), ('Vary', 'Accept-Encoding')]
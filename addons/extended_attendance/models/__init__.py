@@ -2,3 +2,6 @@ from . import person_type
 from . import attendance_location
 from . import extended_person
 from . import extended_attendance
+from . import attendance_daily
+from . import occupancy_sample
+from . import attendance_archive
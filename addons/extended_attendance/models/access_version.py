@@ -0,0 +1,34 @@
+"""Versions keying the cached access maps.
+
+Each version is a system parameter read and written with SQL inside the
+current transaction. A cached map is looked up by the version it was built
+from, so changing access data only makes the workers rebuild that map,
+instead of clearing every ormcache of the registry.
+
+A new version is the id of the transaction changing the access data: a map
+built from changes that are rolled back is keyed by a version that never
+becomes current. Parameters are read without ``get_param``, whose own cache
+is only cleared by ``set_param`` clearing the whole registry cache.
+"""
+
+PERSON_ACCESS_VERSION = 'extended_attendance.person_access_version'
+LOCATION_ACCESS_VERSION = 'extended_attendance.location_access_version'
+# Bumped when locations are created, deleted or recoded (see _get_default_location_id)
+LOCATION_CODE_VERSION = 'extended_attendance.location_code_version'
+
+
+def get_version(cr, key):
+    """Return the current version ``key``"""
+    cr.execute("SELECT value FROM ir_config_parameter WHERE key = %s", [key])
+    row = cr.fetchone()
+    return row[0] if row else None
+
+
+def bump_version(cr, key, uid):
+    """Set the version ``key`` to the current transaction, creating it if needed"""
+    cr.execute("""
+        INSERT INTO ir_config_parameter (key, value, create_uid, create_date, write_uid, write_date)
+        VALUES (%(key)s, txid_current()::text, %(uid)s, now() AT TIME ZONE 'UTC', %(uid)s, now() AT TIME ZONE 'UTC')
+        ON CONFLICT (key) DO UPDATE
+           SET value = EXCLUDED.value, write_uid = EXCLUDED.write_uid, write_date = EXCLUDED.write_date
+    """, {'key': key, 'uid': uid})
@@ -0,0 +1,193 @@
+from odoo import models, fields, api, tools
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# System parameter holding after how many days closed records are archived (0 disables archiving)
+ARCHIVE_DAYS_PARAM = 'extended_attendance.archive_after_days'
+DEFAULT_ARCHIVE_DAYS = 365
+
+# Records moved per transaction by the archiving cron
+ARCHIVE_BATCH_SIZE = 10000
+
+# Columns copied as is from extended_attendance_record
+ARCHIVED_COLUMNS = [
+    'person_id', 'location_id', 'person_type_id', 'device_id', 'check_in', 'check_out',
+    'auto_action', 'notes', 'worked_hours', 'state', 'is_overtime', 'approved_by', 'approval_date',
+    'create_uid', 'create_date', 'write_uid', 'write_date',
+]
+
+
+class ExtendedAttendanceRecordArchive(models.Model):
+    _name = 'extended.attendance.record.archive'
+    _description = 'Archived Extended Attendance Record'
+    _order = 'check_in desc, id desc'
+
+    # Archived rows keep the id of the record they were moved from, so
+    # ids are unique across live and archived records
+    person_id = fields.Many2one(
+        'extended.attendance.person',
+        string='Person',
+        required=True,
+        readonly=True
+    )
+
+    location_id = fields.Many2one(
+        'attendance.location',
+        string='Location',
+        required=True,
+        readonly=True
+    )
+
+    person_type_id = fields.Many2one(
+        'person.type',
+        string='Person Type',
+        readonly=True
+    )
+
+    device_id = fields.Many2one(
+        'attendance.device',
+        string='Device',
+        readonly=True
+    )
+
+    hr_attendance_id = fields.Many2one(
+        'hr.attendance',
+        string='HR Attendance',
+        readonly=True,
+        index='btree_not_null',
+        help='HR attendance the record was bridged from'
+    )
+
+    check_in = fields.Datetime(
+        string='Check In',
+        required=True,
+        readonly=True
+    )
+
+    check_out = fields.Datetime(
+        string='Check Out',
+        readonly=True
+    )
+
+    auto_action = fields.Selection([
+        ('manual', 'Manual'),
+        ('auto_checkin', 'Auto Check-in'),
+        ('auto_checkout', 'Auto Check-out'),
+    ], string='Action Type', readonly=True)
+
+    notes = fields.Text(
+        string='Notes',
+        readonly=True
+    )
+
+    worked_hours = fields.Float(
+        string='Worked Hours',
+        readonly=True
+    )
+
+    # Archived visits are all completed, so their duration is the worked hours
+    duration_hours = fields.Float(
+        string='Duration (Hours)',
+        related='worked_hours'
+    )
+
+    state = fields.Selection([
+        ('checked_in', 'Checked In'),
+        ('checked_out', 'Checked Out'),
+        ('overtime', 'Overtime'),
+        ('incomplete', 'Incomplete')
+    ], string='Status', readonly=True)
+
+    is_overtime = fields.Boolean(
+        string='Is Overtime',
+        readonly=True
+    )
+
+    approved_by = fields.Many2one(
+        'res.users',
+        string='Approved By',
+        readonly=True
+    )
+
+    approval_date = fields.Datetime(
+        string='Approval Date',
+        readonly=True
+    )
+
+    person_name = fields.Char(
+        string='Person Name',
+        related='person_id.name'
+    )
+
+    location_name = fields.Char(
+        string='Location Name',
+        related='location_id.name'
+    )
+
+    def init(self):
+        """Create the (check_in, id) index shared by reports and keyset pagination"""
+        tools.create_index(
+            self._cr, 'extended_attendance_record_archive_check_in_id_idx',
+            self._table, ['check_in DESC', 'id DESC']
+        )
+
+    @api.depends('person_id.name', 'location_id.name', 'check_in')
+    def _compute_display_name(self):
+        for record in self:
+            check_in_str = record.check_in.strftime('%Y-%m-%d %H:%M') if record.check_in else ''
+            record.display_name = f"{record.person_id.name} @ {record.location_id.name} ({check_in_str})"
+
+    @api.model
+    def _cron_archive_records(self):
+        """Move closed attendance records older than the archive horizon here.
+
+        Rows are moved with one ``DELETE ... RETURNING`` feeding an
+        ``INSERT`` per batch of ``ARCHIVE_BATCH_SIZE``, committing after each
+        batch so the live table is never locked for long. The daily
+        summaries read both tables, so they are not affected by the move.
+        """
+        archive_days = int(self.env['ir.config_parameter'].sudo().get_param(ARCHIVE_DAYS_PARAM, DEFAULT_ARCHIVE_DAYS))
+        if not archive_days:
+            return True
+
+        Record = self.env['extended.attendance.record']
+        Record.flush_model()
+        self.env['hr.attendance'].flush_model(['extended_record_id'])
+        params = {
+            'before': self.env.cr.now() - timedelta(days=archive_days),
+            'limit': ARCHIVE_BATCH_SIZE,
+        }
+        columns = ', '.join(ARCHIVED_COLUMNS)
+        moved_columns = ', '.join(f'm.{column}' for column in ARCHIVED_COLUMNS)
+        total = 0
+        while True:
+            self.env.cr.execute(f"""
+                WITH moved AS (
+                    DELETE FROM {Record._table}
+                     WHERE id IN (
+                        SELECT id FROM {Record._table}
+                         WHERE check_out IS NOT NULL AND check_in < %(before)s
+                      ORDER BY check_in
+                         LIMIT %(limit)s
+                     )
+                 RETURNING *
+                )
+                INSERT INTO {self._table} (id, hr_attendance_id, {columns})
+                SELECT m.id, (SELECT min(h.id) FROM hr_attendance h WHERE h.extended_record_id = m.id),
+                       {moved_columns}
+                  FROM moved m
+            """, params)
+            moved = self.env.cr.rowcount
+            self.env.cr.commit()
+            total += moved
+            if moved < ARCHIVE_BATCH_SIZE:
+                break
+
+        Record.invalidate_model()
+        self.env['hr.attendance'].invalidate_model(['extended_record_id'])
+        self.invalidate_model()
+        if total:
+            _logger.info("Archived %s attendance records", total)
+        return True
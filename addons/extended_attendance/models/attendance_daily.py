@@ -0,0 +1,212 @@
+from odoo import models, fields, api, _
+from odoo.exceptions import AccessError
+from datetime import timedelta
+
+# System parameter holding when the rollup was last refreshed
+REFRESHED_AT_PARAM = 'extended_attendance.daily_refreshed_at'
+
+# Records written by transactions still running during the last refresh
+# carry an older write_date, so each refresh looks back a little further
+REFRESH_OVERLAP = timedelta(minutes=5)
+
+# Columns of the live and archived records the rollup is computed from
+ROLLUP_SOURCE_COLUMNS = 'check_in, check_out, person_id, location_id, person_type_id, worked_hours, is_overtime'
+
+# Aggregates of extended.attendance.record rows, archived ones included,
+# shared by refresh and rebuild
+ROLLUP_SELECT = f"""
+    SELECT r.check_in::date, r.person_id, r.location_id, max(r.person_type_id),
+           count(*), coalesce(sum(r.worked_hours), 0),
+           count(*) FILTER (WHERE r.is_overtime),
+           coalesce(sum(r.worked_hours) FILTER (WHERE r.is_overtime), 0),
+           min(r.check_in), max(r.check_out),
+           %(uid)s, %(now)s, %(uid)s, %(now)s
+      FROM (SELECT {ROLLUP_SOURCE_COLUMNS} FROM extended_attendance_record
+            UNION ALL
+            SELECT {ROLLUP_SOURCE_COLUMNS} FROM extended_attendance_record_archive) r
+"""
+ROLLUP_COLUMNS = """
+    date, person_id, location_id, person_type_id,
+    visit_count, worked_hours, overtime_count, overtime_hours,
+    first_check_in, last_check_out,
+    create_uid, create_date, write_uid, write_date
+"""
+
+
+class ExtendedAttendanceDaily(models.Model):
+    _name = 'extended.attendance.daily'
+    _description = 'Daily Attendance Summary'
+    _order = 'date desc, person_id, location_id'
+
+    date = fields.Date(
+        string='Date',
+        required=True,
+        index=True,
+        readonly=True,
+        help='Day of the check-ins (UTC)'
+    )
+
+    person_id = fields.Many2one(
+        'extended.attendance.person',
+        string='Person',
+        required=True,
+        readonly=True,
+        ondelete='cascade'
+    )
+
+    location_id = fields.Many2one(
+        'attendance.location',
+        string='Location',
+        required=True,
+        readonly=True,
+        ondelete='cascade'
+    )
+
+    person_type_id = fields.Many2one(
+        'person.type',
+        string='Person Type',
+        readonly=True
+    )
+
+    visit_count = fields.Integer(
+        string='Visits',
+        readonly=True,
+        help='Number of check-ins at this location on this day'
+    )
+
+    worked_hours = fields.Float(
+        string='Worked Hours',
+        readonly=True,
+        help='Total hours of the completed visits'
+    )
+
+    overtime_count = fields.Integer(
+        string='Overtime Visits',
+        readonly=True
+    )
+
+    overtime_hours = fields.Float(
+        string='Overtime Hours',
+        readonly=True,
+        help='Total hours of the visits flagged as overtime'
+    )
+
+    first_check_in = fields.Datetime(
+        string='First Check In',
+        readonly=True
+    )
+
+    last_check_out = fields.Datetime(
+        string='Last Check Out',
+        readonly=True
+    )
+
+    _sql_constraints = [
+        ('date_person_location_unique', 'UNIQUE(date, person_id, location_id)',
+         'There can only be one daily summary per person, location and day!'),
+    ]
+
+    @api.model
+    def _refresh_keys(self, keys):
+        """Recompute the summary rows of the given ``(date, person_id, location_id)`` keys.
+
+        Rows are deleted and re-aggregated from the attendance records, so
+        keys whose records were all removed or moved simply disappear.
+        """
+        keys = list(set(keys))
+        if not keys:
+            return
+        self.env['extended.attendance.record'].flush_model()
+        dates, person_ids, location_ids = zip(*keys)
+        params = {
+            'dates': [str(date) for date in dates],
+            'person_ids': list(person_ids),
+            'location_ids': list(location_ids),
+            'uid': self.env.uid,
+            'now': self.env.cr.now(),
+        }
+        keys_query = """
+            SELECT * FROM unnest(%(dates)s::date[], %(person_ids)s::int[], %(location_ids)s::int[])
+        """
+        self.env.cr.execute(f"""
+            DELETE FROM {self._table}
+             WHERE (date, person_id, location_id) IN ({keys_query})
+        """, params)
+        self.env.cr.execute(f"""
+            INSERT INTO {self._table} ({ROLLUP_COLUMNS})
+            {ROLLUP_SELECT}
+             WHERE r.person_id = ANY(%(person_ids)s)
+               AND (r.check_in::date, r.person_id, r.location_id) IN ({keys_query})
+          GROUP BY r.check_in::date, r.person_id, r.location_id
+        """, params)
+        self.invalidate_model()
+
+    @api.model
+    def _cron_refresh(self):
+        """Refresh the summaries of every record changed since the last run"""
+        ICP = self.env['ir.config_parameter'].sudo()
+        refreshed_at = ICP.get_param(REFRESHED_AT_PARAM)
+        if not refreshed_at:
+            return self.sudo().action_rebuild()
+
+        now = self.env.cr.now()
+        self.env['extended.attendance.record'].flush_model()
+        self.env.cr.execute("""
+            SELECT DISTINCT check_in::date, person_id, location_id
+              FROM extended_attendance_record
+             WHERE write_date >= %s
+        """, [fields.Datetime.to_datetime(refreshed_at) - REFRESH_OVERLAP])
+        self._refresh_keys(self.env.cr.fetchall())
+        ICP.set_param(REFRESHED_AT_PARAM, fields.Datetime.to_string(now))
+        return True
+
+    @api.model
+    def action_rebuild(self):
+        """Drop and recompute every summary row from the attendance records"""
+        if not self.env.su and not self.env.user.has_group('extended_attendance.group_attendance_manager'):
+            raise AccessError(_('Only attendance managers can rebuild the daily summaries.'))
+
+        now = self.env.cr.now()
+        self.env['extended.attendance.record'].flush_model()
+        self.env.cr.execute(f"DELETE FROM {self._table}")
+        self.env.cr.execute(f"""
+            INSERT INTO {self._table} ({ROLLUP_COLUMNS})
+            {ROLLUP_SELECT}
+          GROUP BY r.check_in::date, r.person_id, r.location_id
+        """, {'uid': self.env.uid, 'now': now})
+        self.invalidate_model()
+        self.env['ir.config_parameter'].sudo().set_param(REFRESHED_AT_PARAM, fields.Datetime.to_string(now))
+        return True
+
+    @api.model
+    def get_daily_trend(self, date_from, date_to, location_code=None, person_type_code=None):
+        """Return visits, distinct persons and hours per day from the rollup.
+
+        An unknown location or person type code returns no days.
+        """
+        domain = [('date', '>=', date_from), ('date', '<=', date_to)]
+
+        if location_code:
+            location = self.env['attendance.location'].search([('code', '=', location_code)], limit=1)
+            if not location:
+                return []
+            domain.append(('location_id', 'child_of', location.id))
+
+        if person_type_code:
+            person_type = self.env['person.type'].search([('code', '=', person_type_code)], limit=1)
+            if not person_type:
+                return []
+            domain.append(('person_type_id', '=', person_type.id))
+
+        groups = self._read_group(
+            domain, ['date:day'],
+            ['visit_count:sum', 'person_id:count_distinct', 'worked_hours:sum', 'overtime_hours:sum'],
+            order='date:day',
+        )
+        return [{
+            'date': fields.Date.to_string(day),
+            'visits': visits,
+            'unique_persons': persons,
+            'worked_hours': round(worked_hours, 2),
+            'overtime_hours': round(overtime_hours, 2),
+        } for day, visits, persons, worked_hours, overtime_hours in groups]
@@ -1,5 +1,27 @@
-from odoo import models, fields, api, _
-from odoo.exceptions import ValidationError, UserError
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import AccessError, ValidationError, UserError
+from .access_version import LOCATION_ACCESS_VERSION, LOCATION_CODE_VERSION, get_version, bump_version
+import json
+
+# Columns set by import_location_tree, with their SQL type and the value
+# new locations get when the document leaves them out
+LOCATION_IMPORT_COLUMNS = {
+    'name': ('varchar', None),
+    'description': ('text', None),
+    'sequence': ('integer', 10),
+    'active': ('boolean', True),
+    'building': ('varchar', None),
+    'floor': ('varchar', None),
+    'room_number': ('varchar', None),
+    'capacity': ('integer', None),
+    'color': ('integer', 0),
+    'latitude': ('numeric', None),
+    'longitude': ('numeric', None),
+    'requires_permission': ('boolean', False),
+}
+
+# Locations inserted or updated per statement by import_location_tree
+LOCATION_IMPORT_BATCH_SIZE = 1000
 
 
 class AttendanceLocation(models.Model):
@@ -7,6 +29,10 @@ class AttendanceLocation(models.Model):
     _description = 'Attendance Location'
     _order = 'sequence, name'
     _rec_name = 'name'
+    _parent_name = 'parent_location_id'
+
+    # Fields feeding the compiled access matrix (see _get_location_access_map)
+    _ACCESS_MATRIX_FIELDS = {'allowed_person_type_ids', 'has_operating_hours'}
 
     name = fields.Char(
         string='Location Name',
@@ -71,26 +97,6 @@ class AttendanceLocation(models.Model):
         help='Color for UI display'
     )
     
-    # Location hierarchy
-    parent_location_id = fields.Many2one(
-        'attendance.location',
-        string='Parent Location',
-        help='Parent location for hierarchical organization'
-    )
-
-    child_location_ids = fields.One2many(
-        'attendance.location',
-        'parent_location_id',
-        string='Child Locations'
-    )
-    
-    location_path = fields.Char(
-        string='Location Path',
-        compute='_compute_location_path',
-        store=True,
-        help='Full path of the location hierarchy'
-    )
-    
     # Physical details
     building = fields.Char(
         string='Building',
@@ -172,7 +178,9 @@ class AttendanceLocation(models.Model):
         string='Attendance Devices'
     )
 
-    @api.depends('name', 'parent_location_id.location_path')
+    # Only the location's own fields are dependencies: paths and levels of
+    # descendants are refreshed in one query by _recompute_hierarchy
+    @api.depends('name', 'parent_location_id')
     def _compute_location_path(self):
         """Compute the full path of the location hierarchy"""
         for record in self:
@@ -211,14 +219,7 @@ class AttendanceLocation(models.Model):
     def _compute_hierarchy_level(self):
         """Compute the hierarchy level of this location"""
         for record in self:
-            level = 0
-            current = record
-            while current.parent_location_id:
-                level += 1
-                current = current.parent_location_id
-                if level > 10:  # Prevent infinite loops
-                    break
-            record.level = level
+            record.level = record.parent_location_id.level + 1 if record.parent_location_id else 0
 
     @api.constrains('code')
     def _check_code_unique(self):
@@ -265,16 +266,86 @@ class AttendanceLocation(models.Model):
             'context': {'default_location_id': self.id},
         }
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Override create to invalidate the compiled access matrix when the
+        new locations are restricted or scheduled (unrestricted ones are open
+        without being listed in it)"""
+        records = super().create(vals_list)
+        if any(vals.get(field) for vals in vals_list for field in self._ACCESS_MATRIX_FIELDS):
+            bump_version(self.env.cr, LOCATION_ACCESS_VERSION, self.env.uid)
+        bump_version(self.env.cr, LOCATION_CODE_VERSION, self.env.uid)
+        return records
+
+    def write(self, vals):
+        """Override write to invalidate the access matrix on relevant changes
+        and to refresh the paths and levels of moved or renamed subtrees"""
+        res = super().write(vals)
+        if self._ACCESS_MATRIX_FIELDS.intersection(vals):
+            bump_version(self.env.cr, LOCATION_ACCESS_VERSION, self.env.uid)
+        if 'code' in vals:
+            bump_version(self.env.cr, LOCATION_CODE_VERSION, self.env.uid)
+        if 'name' in vals or 'parent_location_id' in vals:
+            self._recompute_hierarchy()
+        return res
+
+    def unlink(self):
+        """Override unlink to refresh the cached default location id"""
+        res = super().unlink()
+        bump_version(self.env.cr, LOCATION_CODE_VERSION, self.env.uid)
+        return res
+
+    @api.model
+    def _get_location_access_map(self):
+        """Return the compiled person type -> location access map.
+
+        Returns a tuple ``(type_locations, restricted_location_ids,
+        scheduled_location_ids)``: ``type_locations`` maps a person type id to
+        the frozenset of restricted locations it may access,
+        ``restricted_location_ids`` holds locations with type restrictions and
+        ``scheduled_location_ids`` holds locations with operating hours.
+        Locations missing from it are open all the time, so creating or
+        deleting plain locations leaves it valid.
+
+        The result is cached per worker and rebuilt whenever the allowed
+        person types or operating hours of a location change, which bumps
+        its version.
+        """
+        return self._build_location_access_map(get_version(self.env.cr, LOCATION_ACCESS_VERSION))
+
+    @api.model
+    @tools.ormcache('version')
+    def _build_location_access_map(self, version):
+        """Compile the location access map of access data ``version``"""
+        self.flush_model(['allowed_person_type_ids', 'has_operating_hours'])
+        field = self._fields['allowed_person_type_ids']
+
+        self.env.cr.execute(f"""
+            SELECT {field.column1}, {field.column2} FROM {field.relation}
+        """)
+        type_locations = {}
+        for location_id, type_id in self.env.cr.fetchall():
+            type_locations.setdefault(type_id, set()).add(location_id)
+
+        self.env.cr.execute(f"SELECT id FROM {self._table} WHERE has_operating_hours")
+
+        return (
+            {type_id: frozenset(ids) for type_id, ids in type_locations.items()},
+            frozenset().union(*type_locations.values()),
+            frozenset(loc_id for loc_id, in self.env.cr.fetchall()),
+        )
+
     def check_access_permission(self, person):
         """Check if a person has permission to access this location"""
         self.ensure_one()
+        type_locations, restricted_location_ids, _scheduled = self._get_location_access_map()
 
-        # If no specific person types are defined, allow all
-        if not self.allowed_person_type_ids:
+        # Locations without specific person types allow all
+        if self.id not in restricted_location_ids:
             return True
 
         # Check if person's type is in allowed types
-        return person.person_type_id in self.allowed_person_type_ids
+        return self.id in type_locations.get(person.person_type_id.id, ())
 
     def is_operating_now(self):
         """Check if the location is currently operating"""
@@ -328,10 +399,243 @@ class AttendanceLocation(models.Model):
             }
         ]
         
-        for location_data in default_locations:
-            existing = self.search([('code', '=', location_data['code'])])
-            if not existing:
-                self.create(location_data)
+        # Run by any user on first use, while the import is for managers
+        self.sudo().import_location_tree(default_locations, update_existing=False)
+
+    @api.model
+    def _flatten_location_tree(self, locations, parent=None):
+        """Yield ``(node, parent)`` for the nodes of a nested or
+        adjacency-list location document, parents first. Nested nodes get the
+        code of their parent under ``parent_code`` and are yielded with the
+        parent node itself, which is None for top-level nodes."""
+        for node in locations:
+            node = dict(node)
+            children = node.pop('children', None) or []
+            if parent and parent.get('code'):
+                node['parent_code'] = parent['code']
+            yield node, parent
+            yield from self._flatten_location_tree(children, node)
+
+    @api.model
+    def import_location_tree(self, locations, update_existing=True):
+        """Create or update a whole location hierarchy at once.
+
+        ``locations`` (a list, or its JSON text) holds location dicts with a
+        ``code``, a ``name`` and optional :data:`LOCATION_IMPORT_COLUMNS`.
+        Parents are given by nesting nodes under ``children`` or by a
+        ``parent_code`` referring to the document or to an existing location;
+        nodes without either become roots. Locations whose code exists are
+        updated (moved under their new parent, omitted columns kept) unless
+        ``update_existing`` is False.
+
+        Parents are resolved in memory, then every hierarchy level is written
+        with one INSERT and one UPDATE per ``LOCATION_IMPORT_BATCH_SIZE``
+        locations, and paths and levels are computed once at the end.
+
+        Returns ``{total, created, updated, errors}`` where ``errors`` lists
+        the ``code`` and ``error`` of every rejected location; the children
+        of a rejected location are rejected too. Restricted to attendance
+        managers, as it can rename and move any location.
+        """
+        if not self.env.su and not self.env.user.has_group('extended_attendance.group_attendance_manager'):
+            raise AccessError(_('Only attendance managers can import locations.'))
+        self.check_access_rights('create')
+        if update_existing:
+            self.check_access_rights('write')
+        if isinstance(locations, str):
+            locations = json.loads(locations)
+
+        nodes = list(self._flatten_location_tree(locations))
+        errors = []
+        by_code = {}
+        # Nodes rejected here, whose nested children would otherwise be
+        # attached to another node with the same code
+        rejected_nodes = set()
+        for node, parent in nodes:
+            code = node.get('code')
+            if parent is not None and id(parent) in rejected_nodes:
+                errors.append({'code': code or False, 'error': _('Parent location %s was rejected.') % (parent.get('code') or '')})
+            elif not code or not node.get('name'):
+                errors.append({'code': code or False, 'error': _('Code and name are required.')})
+            elif code in by_code:
+                errors.append({'code': code, 'error': _('Location code is repeated in the document.')})
+            else:
+                by_code[code] = node
+                continue
+            rejected_nodes.add(id(node))
+
+        self.flush_model()
+        self.env.cr.execute(f"SELECT code, id FROM {self._table} WHERE code = ANY(%s)", [
+            list(by_code) + [node['parent_code'] for node in by_code.values() if node.get('parent_code')]
+        ])
+        existing = dict(self.env.cr.fetchall())
+        # Existing locations that must not be updated are left as they are,
+        # but still parent the new locations nested under them
+        skipped = set()
+        if not update_existing:
+            skipped = {code for code in by_code if code in existing}
+            errors += [{'code': code, 'error': _('Location code already exists.')} for code in skipped]
+
+        # Group the locations by hierarchy level, parents first
+        levels = []
+        rejected = set()
+        placed = set(skipped)
+        pending = [node for code, node in by_code.items() if code not in skipped]
+        while pending:
+            level, waiting = [], []
+            for node in pending:
+                parent_code = node.get('parent_code')
+                if parent_code in rejected:
+                    errors.append({'code': node['code'], 'error': _('Parent location %s was rejected.') % parent_code})
+                    rejected.add(node['code'])
+                elif not parent_code or parent_code in placed or (parent_code not in by_code and parent_code in existing):
+                    level.append(node)
+                elif parent_code not in by_code:
+                    errors.append({'code': node['code'], 'error': _('Unknown parent location %s.') % parent_code})
+                    rejected.add(node['code'])
+                else:
+                    waiting.append(node)
+            if not level and len(waiting) == len(pending):
+                for node in waiting:
+                    errors.append({'code': node['code'], 'error': _('Parent locations form a cycle.')})
+                break
+            if level:
+                levels.append(level)
+            placed.update(node['code'] for node in level)
+            pending = waiting
+
+        record_def = ', '.join(
+            ['code varchar', 'parent_code varchar']
+            + [f'{column} {sql_type}' for column, (sql_type, default) in LOCATION_IMPORT_COLUMNS.items()]
+        )
+        params = {'uid': self.env.uid, 'now': self.env.cr.now()}
+        updated_ids, created_ids = [], []
+        for level in levels:
+            for start in range(0, len(level), LOCATION_IMPORT_BATCH_SIZE):
+                params['rows'] = json.dumps([
+                    {key: value for key, value in node.items() if key in LOCATION_IMPORT_COLUMNS or key in ('code', 'parent_code')}
+                    for node in level[start:start + LOCATION_IMPORT_BATCH_SIZE]
+                ])
+                self.env.cr.execute(f"""
+                    UPDATE {self._table} l
+                       SET {', '.join(f'{column} = coalesce(s.{column}, l.{column})' for column in LOCATION_IMPORT_COLUMNS)},
+                           parent_location_id = p.id,
+                           write_uid = %(uid)s, write_date = %(now)s
+                      FROM jsonb_to_recordset(%(rows)s) AS s({record_def})
+                 LEFT JOIN {self._table} p ON p.code = s.parent_code
+                     WHERE l.code = s.code
+                 RETURNING l.id
+                """, params)
+                updated_ids += [row[0] for row in self.env.cr.fetchall()]
+                self.env.cr.execute(f"""
+                    INSERT INTO {self._table} (
+                        code, parent_location_id, {', '.join(LOCATION_IMPORT_COLUMNS)},
+                        has_operating_hours, create_uid, create_date, write_uid, write_date
+                    )
+                    SELECT s.code, p.id, {', '.join(
+                        f's.{column}' if default is None else f'coalesce(s.{column}, %(default_{column})s)'
+                        for column, (sql_type, default) in LOCATION_IMPORT_COLUMNS.items()
+                    )}, FALSE, %(uid)s, %(now)s, %(uid)s, %(now)s
+                      FROM jsonb_to_recordset(%(rows)s) AS s({record_def})
+                 LEFT JOIN {self._table} p ON p.code = s.parent_code
+                     WHERE NOT EXISTS (SELECT 1 FROM {self._table} l WHERE l.code = s.code)
+                 RETURNING id
+                """, dict(params, **{
+                    f'default_{column}': default for column, (sql_type, default) in LOCATION_IMPORT_COLUMNS.items()
+                }))
+                created_ids += [row[0] for row in self.env.cr.fetchall()]
+
+        self.invalidate_model()
+        imported = self.browse(updated_ids + created_ids)
+        # Moving existing locations may close a loop through the database
+        if not imported._check_recursion(parent='parent_location_id'):
+            raise ValidationError(_('You cannot create recursive location hierarchies.'))
+        imported._recompute_hierarchy()
+        if created_ids:
+            bump_version(self.env.cr, LOCATION_CODE_VERSION, self.env.uid)
+        return {
+            'total': len(nodes),
+            'created': len(created_ids),
+            'updated': len(updated_ids),
+            'errors': errors,
+        }
+
+    @api.model
+    def action_recompute_hierarchy(self):
+        """Recompute the path and level of every location from the roots down"""
+        if not self.env.su and not self.env.user.has_group('extended_attendance.group_attendance_manager'):
+            raise AccessError(_('Only attendance managers can recompute the location hierarchy.'))
+        self.with_context(active_test=False).search([('parent_location_id', '=', False)])._recompute_hierarchy()
+        return True
+
+    def _recompute_hierarchy(self):
+        """Recompute ``location_path`` and ``level`` of these locations and
+        all their descendants with one recursive query.
+
+        Each location is reached from every selected ancestor; the row
+        coming from the topmost one is kept, as its path starts from a
+        parent that is not being recomputed.
+        """
+        if not self:
+            return
+        self.flush_model(['name', 'parent_location_id', 'location_path', 'level'])
+        self.env.cr.execute(f"""
+            WITH RECURSIVE tree AS (
+                SELECT l.id,
+                       CASE WHEN p.id IS NULL THEN l.name ELSE p.location_path || ' / ' || l.name END AS path,
+                       CASE WHEN p.id IS NULL THEN 0 ELSE p.level + 1 END AS level,
+                       0 AS depth
+                  FROM {self._table} l
+             LEFT JOIN {self._table} p ON p.id = l.parent_location_id
+                 WHERE l.id = ANY(%s)
+                 UNION ALL
+                SELECT c.id, t.path || ' / ' || c.name, t.level + 1, t.depth + 1
+                  FROM {self._table} c
+                  JOIN tree t ON c.parent_location_id = t.id
+            )
+            UPDATE {self._table} l
+               SET location_path = t.path, level = t.level
+              FROM (SELECT DISTINCT ON (id) id, path, level FROM tree ORDER BY id, depth DESC) t
+             WHERE l.id = t.id
+               AND (l.location_path IS DISTINCT FROM t.path OR l.level IS DISTINCT FROM t.level)
+        """, [self.ids])
+        self.invalidate_model(['location_path', 'level'])
+
+    @api.model
+    def get_location_tree(self, domain=None):
+        """Return locations as a nested tree built in a single pass.
+
+        Each node carries the stored ``level`` and ``location_path`` plus a
+        ``children`` list, so clients can render the hierarchy without walking
+        parent links. Reading in level order guarantees parents are placed
+        before their children.
+        """
+        locations = self.search_read(
+            domain or [('active', '=', True)],
+            ['name', 'code', 'capacity', 'current_occupancy', 'building', 'floor', 'active',
+             'parent_location_id', 'level', 'location_path'],
+            order='level, sequence, name'
+        )
+
+        nodes = {}
+        roots = []
+        for location in locations:
+            parent = location['parent_location_id']
+            node = dict(
+                location,
+                building=location['building'] or '',
+                floor=location['floor'] or '',
+                parent_location_id=parent and parent[0],
+                parent_location_name=parent and parent[1],
+                children=[],
+            )
+            nodes[node['id']] = node
+            if parent and parent[0] in nodes:
+                nodes[parent[0]]['children'].append(node)
+            else:
+                roots.append(node)
+
+        return roots
 
     def get_all_parent_locations(self):
         """Get all parent locations up to the root"""
@@ -1,6 +1,41 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
+from odoo.tools import SQL
 from odoo.exceptions import ValidationError, UserError
+from .access_version import LOCATION_CODE_VERSION, get_version
 from datetime import datetime, timedelta
+import logging
+import pytz
+
+_logger = logging.getLogger(__name__)
+
+# Bus channel carrying live check-in/check-out and occupancy deltas
+PRESENCE_CHANNEL = 'extended_attendance.presence'
+
+# hr.attendance fields copied to the linked extended record
+HR_SYNC_FIELDS = ['check_in', 'check_out', 'location_id']
+HR_SYNC_BATCH_SIZE = 1000
+
+# Duration comparison -> comparison on check_in giving the same ongoing visits
+DURATION_OPERATORS = {'>': '<', '>=': '<=', '<': '>', '<=': '>='}
+
+# Records re-flagged per transaction when a type's max_duration_hours changes
+OVERTIME_BATCH_SIZE = 5000
+
+# Fields identifying the extended.attendance.daily row a record belongs to
+ROLLUP_KEY_FIELDS = {'check_in', 'person_id', 'location_id'}
+
+# Columns of the live and archived records aggregated by the reports
+REPORT_COLUMNS = ['check_in', 'check_out', 'worked_hours', 'location_id', 'person_id', 'person_type_id']
+
+# Report groupings handled by get_attendance_report, with their column
+REPORT_GROUPS = {
+    'day': 'check_in',
+    'week': 'check_in',
+    'month': 'check_in',
+    'location': 'location_id',
+    'person_type': 'person_type_id',
+    'person': 'person_id',
+}
 
 
 class ExtendedAttendanceRecord(models.Model):
@@ -8,6 +43,7 @@ class ExtendedAttendanceRecord(models.Model):
     _description = 'Extended Attendance Record'
     _order = 'check_in desc'
     _rec_name = 'display_name'
+    _rec_names_search = ['person_name', 'location_name']
 
     # Core fields
     person_id = fields.Many2one(
@@ -59,8 +95,7 @@ class ExtendedAttendanceRecord(models.Model):
     # Computed fields
     display_name = fields.Char(
         string='Display Name',
-        compute='_compute_display_name',
-        store=True
+        compute='_compute_display_name'
     )
     
     worked_hours = fields.Float(
@@ -70,6 +105,13 @@ class ExtendedAttendanceRecord(models.Model):
         help='Number of hours between check-in and check-out'
     )
     
+    duration_hours = fields.Float(
+        string='Duration (Hours)',
+        compute='_compute_duration_hours',
+        search='_search_duration_hours',
+        help='Worked hours, or hours elapsed since check-in for ongoing visits'
+    )
+    
     duration_display = fields.Char(
         string='Duration',
         compute='_compute_duration_display',
@@ -108,26 +150,48 @@ class ExtendedAttendanceRecord(models.Model):
         help='Date when this record was approved'
     )
     
-    # Related fields for easy access
+    # Type of the person at the time of the visit, kept for reporting.
+    # Only depends on this record's person_id, so changing a person's type
+    # doesn't rewrite their attendance history
     person_type_id = fields.Many2one(
         'person.type',
         string='Person Type',
-        related='person_id.person_type_id',
-        store=True
+        compute='_compute_person_type_id',
+        store=True,
+        readonly=False,
+        precompute=True
     )
     
+    # Related fields for easy access, read through the person and location
+    # so renaming them doesn't rewrite every historical record
     person_name = fields.Char(
         string='Person Name',
-        related='person_id.name',
-        store=True
+        related='person_id.name'
     )
     
     location_name = fields.Char(
         string='Location Name',
-        related='location_id.name',
-        store=True
+        related='location_id.name'
     )
 
+    def init(self):
+        """Create the (check_in, id) index backing keyset pagination, the
+        write_date index used to find records changed since the last daily
+        summary refresh and the per person and location index used by the
+        overlap check"""
+        tools.create_index(
+            self._cr, 'extended_attendance_record_check_in_id_idx',
+            self._table, ['check_in DESC', 'id DESC']
+        )
+        tools.create_index(
+            self._cr, 'extended_attendance_record_write_date_idx',
+            self._table, ['write_date']
+        )
+        tools.create_index(
+            self._cr, 'extended_attendance_record_person_location_idx',
+            self._table, ['person_id', 'location_id', 'check_in']
+        )
+
     @api.depends('person_id.name', 'location_id.name', 'check_in')
     def _compute_display_name(self):
         """Compute display name for the record"""
@@ -138,6 +202,12 @@ class ExtendedAttendanceRecord(models.Model):
             else:
                 record.display_name = "Attendance Record"
 
+    @api.depends('person_id')
+    def _compute_person_type_id(self):
+        """Take the person type from the person when the record is created or reassigned"""
+        for record in self:
+            record.person_type_id = record.person_id.person_type_id
+
     @api.depends('check_in', 'check_out')
     def _compute_worked_hours(self):
         """Compute worked hours"""
@@ -149,22 +219,41 @@ class ExtendedAttendanceRecord(models.Model):
                 record.worked_hours = 0.0
 
     @api.depends('worked_hours', 'check_in', 'check_out')
+    def _compute_duration_hours(self):
+        """Compute the duration, up to now for ongoing visits"""
+        now = fields.Datetime.now()
+        for record in self:
+            if record.check_in and not record.check_out:
+                record.duration_hours = (now - record.check_in).total_seconds() / 3600.0
+            else:
+                record.duration_hours = record.worked_hours
+
+    def _search_duration_hours(self, operator, value):
+        """Translate duration comparisons into a domain on stored columns.
+
+        Closed visits compare their stored ``worked_hours``; an ongoing visit
+        has lasted more than ``value`` hours when it started more than
+        ``value`` hours ago, so the filter runs in the database.
+        """
+        if operator not in DURATION_OPERATORS:
+            raise UserError(_('Unsupported operator %s for searching on the duration.') % operator)
+        started_before = fields.Datetime.now() - timedelta(hours=value)
+        return ['|',
+                '&', ('check_out', '!=', False), ('worked_hours', operator, value),
+                '&', ('check_out', '=', False), ('check_in', DURATION_OPERATORS[operator], started_before)]
+
+    @api.depends('duration_hours')
     def _compute_duration_display(self):
         """Compute human-readable duration"""
         for record in self:
-            if record.check_in and record.check_out:
-                delta = record.check_out - record.check_in
-                hours = int(delta.total_seconds() // 3600)
-                minutes = int((delta.total_seconds() % 3600) // 60)
-                record.duration_display = f"{hours}h {minutes}m"
-            elif record.check_in:
-                # Currently checked in - show elapsed time
-                delta = datetime.now() - record.check_in.replace(tzinfo=None)
-                hours = int(delta.total_seconds() // 3600)
-                minutes = int((delta.total_seconds() % 3600) // 60)
-                record.duration_display = f"{hours}h {minutes}m (ongoing)"
-            else:
+            if not record.check_in:
                 record.duration_display = "N/A"
+                continue
+            minutes = int(record.duration_hours * 60)
+            record.duration_display = f"{minutes // 60}h {minutes % 60}m"
+            if not record.check_out:
+                # Currently checked in - show elapsed time
+                record.duration_display += " (ongoing)"
 
     @api.depends('check_in', 'check_out', 'worked_hours')
     def _compute_state(self):
@@ -181,16 +270,137 @@ class ExtendedAttendanceRecord(models.Model):
             else:
                 record.state = 'incomplete'
 
-    @api.depends('worked_hours', 'person_id.person_type_id.max_duration_hours')
+    @api.depends('worked_hours', 'person_type_id')
     def _compute_overtime(self):
-        """Compute if this is overtime"""
+        """Compute if this is overtime.
+
+        Changes of a type's ``max_duration_hours`` are applied to existing
+        records in batches by :meth:`_cron_recompute_overtime`.
+        """
         for record in self:
-            max_hours = record.person_id.person_type_id.max_duration_hours
+            max_hours = record.person_type_id.max_duration_hours
             if max_hours > 0 and record.worked_hours > max_hours:
                 record.is_overtime = True
             else:
                 record.is_overtime = False
 
+    @api.model
+    def _cron_recompute_overtime(self):
+        """Re-flag overtime on the records of person types whose limit changed.
+
+        Rows are updated with SQL in batches of ``OVERTIME_BATCH_SIZE``,
+        committing after each one so the attendance table is never locked
+        for long. Only rows whose flag actually changes are touched, and
+        they get a new ``write_date`` so the daily summaries pick them up.
+
+        A type's pending flag is cleared before its rows are processed, so a
+        limit change made during the run flags it again for the next run.
+        """
+        self.flush_model(['worked_hours', 'person_type_id', 'is_overtime'])
+        for person_type in self.env['person.type'].search([('overtime_recompute_pending', '=', True)]):
+            max_hours = person_type.max_duration_hours
+            person_type.overtime_recompute_pending = False
+            self.env.cr.commit()
+            while True:
+                self.env.cr.execute(f"""
+                    UPDATE {self._table}
+                       SET is_overtime = (%(max_hours)s > 0 AND worked_hours > %(max_hours)s),
+                           write_uid = %(uid)s, write_date = now() AT TIME ZONE 'UTC'
+                     WHERE id IN (
+                        SELECT id FROM {self._table}
+                         WHERE person_type_id = %(type_id)s
+                           AND is_overtime IS DISTINCT FROM (%(max_hours)s > 0 AND worked_hours > %(max_hours)s)
+                         LIMIT %(limit)s
+                     )
+                """, {'max_hours': max_hours, 'type_id': person_type.id, 'limit': OVERTIME_BATCH_SIZE, 'uid': self.env.uid})
+                updated = self.env.cr.rowcount
+                self.env.cr.commit()
+                if updated < OVERTIME_BATCH_SIZE:
+                    break
+        self.invalidate_model(['is_overtime', 'write_uid', 'write_date'])
+        return True
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Override create to publish new check-ins on the presence channel"""
+        records = super().create(vals_list)
+        records.filtered(lambda r: not r.check_out)._notify_presence('check_in')
+        return records
+
+    def write(self, vals):
+        """Override write to publish presence changes on the presence channel.
+
+        Open records that are checked out or moved to another location leave
+        their current location, and moved or reopened records then arrive at
+        their new one.
+        """
+        open_records = self.filtered(lambda r: not r.check_out)
+        checked_out = moved = reopened = self.browse()
+        if vals.get('check_out'):
+            checked_out = open_records
+        elif 'location_id' in vals:
+            moved = open_records.filtered(lambda r: r.location_id.id != vals['location_id'])
+        if 'check_out' in vals and not vals['check_out']:
+            reopened = self - open_records
+        # Sent before writing so the check-outs report the locations being left
+        checked_out._notify_presence('check_out')
+        moved._notify_presence('check_out', reason='move')
+        # Summaries the records move away from are not found by the daily refresh
+        moved_keys = self._get_daily_keys() if ROLLUP_KEY_FIELDS.intersection(vals) else []
+        res = super().write(vals)
+        moved._notify_presence('check_in', reason='move')
+        reopened._notify_presence('check_in', reason='reopen')
+        if moved_keys:
+            self.env['extended.attendance.daily']._refresh_keys(moved_keys + self._get_daily_keys())
+        return res
+
+    def unlink(self):
+        """Override unlink to publish deleted open records as check-outs and
+        to drop the records from the daily summaries"""
+        self.filtered(lambda r: not r.check_out)._notify_presence('check_out', reason='delete')
+        keys = self._get_daily_keys()
+        res = super().unlink()
+        self.env['extended.attendance.daily']._refresh_keys(keys)
+        return res
+
+    def _get_daily_keys(self):
+        """Return the (date, person, location) daily summary keys of these records"""
+        return [(record.check_in.date(), record.person_id.id, record.location_id.id) for record in self]
+
+    def _notify_presence(self, event, reason=None):
+        """Send one bus notification describing these records' presence change.
+
+        The payload lists the changed records and the per-location occupancy
+        delta, so subscribed clients can patch their state instead of
+        reloading the whole current-attendance list. ``reason`` tells moves,
+        reopenings and deletions apart from actual check-ins and check-outs.
+        """
+        if not self:
+            return
+
+        delta = 1 if event == 'check_in' else -1
+        occupancy = {}
+        events = []
+        for record in self:
+            occupancy[record.location_id.id] = occupancy.get(record.location_id.id, 0) + delta
+            events.append({
+                'type': event,
+                'id': record.id,
+                'person_id': record.person_id.id,
+                'person_name': record.person_name,
+                'location_id': record.location_id.id,
+                'location_name': record.location_name,
+                'check_in': fields.Datetime.to_string(record.check_in),
+                'check_out': fields.Datetime.to_string(record.check_out),
+                'auto_action': record.auto_action,
+                'reason': reason or False,
+            })
+
+        self.env['bus.bus']._sendone(PRESENCE_CHANNEL, 'extended_attendance/presence', {
+            'events': events,
+            'occupancy': occupancy,
+        })
+
     @api.constrains('check_in', 'check_out')
     def _check_dates(self):
         """Validate check-in and check-out times"""
@@ -198,21 +408,33 @@ class ExtendedAttendanceRecord(models.Model):
             if record.check_out and record.check_in and record.check_out <= record.check_in:
                 raise ValidationError(_('Check-out time must be after check-in time.'))
 
-    @api.constrains('person_id', 'check_in', 'location_id')
+    @api.constrains('person_id', 'check_in', 'check_out', 'location_id')
     def _check_overlapping_attendance(self):
-        """Prevent duplicate attendance records at the same location"""
-        for record in self:
-            if not record.check_out:  # Only check for open records
-                # Only prevent overlapping at the SAME location (not different locations)
-                overlapping = self.search([
-                    ('person_id', '=', record.person_id.id),
-                    ('location_id', '=', record.location_id.id),  # Same location only
-                    ('id', '!=', record.id),
-                    ('check_out', '=', False)
-                ])
-                if overlapping:
-                    raise ValidationError(_('Person %s is already checked in at %s.') %
-                                        (record.person_id.name, record.location_id.name))
+        """Prevent overlapping attendance records at the same location.
+
+        Visits are compared as ``[check_in, check_out)`` ranges, open ones
+        extending to infinity, in a single query for the whole recordset.
+        """
+        self.flush_model(['person_id', 'location_id', 'check_in', 'check_out'])
+        self.env.cr.execute(f"""
+            SELECT r.id, o.id
+              FROM {self._table} r
+              JOIN {self._table} o
+                ON o.person_id = r.person_id
+               AND o.location_id = r.location_id  -- Same location only
+               AND o.id != r.id
+               AND tsrange(o.check_in, o.check_out, '[)') && tsrange(r.check_in, r.check_out, '[)')
+             WHERE r.id = ANY(%s)
+             LIMIT 1
+        """, [self.ids])
+        overlap = self.env.cr.fetchone()
+        if overlap:
+            record, other = self.browse(overlap)
+            if not other.check_out:
+                raise ValidationError(_('Person %s is already checked in at %s.') %
+                                      (record.person_id.name, record.location_id.name))
+            raise ValidationError(_('Attendance of %s at %s overlaps the visit from %s to %s.') %
+                                  (record.person_id.name, record.location_id.name, other.check_in, other.check_out))
 
     def action_check_out(self, check_out_time=None):
         """Check out the person"""
@@ -299,8 +521,102 @@ class ExtendedAttendanceRecord(models.Model):
         return self.search(domain)
 
     @api.model
-    def get_attendance_report(self, date_from, date_to, location_code=None, person_type_code=None):
-        """Generate attendance report for a date range"""
+    def get_presence_last_id(self):
+        """Return the id of the latest bus notification.
+
+        Clients loading the current attendance subscribe to the presence
+        channel from this id, so notifications already reflected in the
+        loaded data are not replayed.
+        """
+        return self.env['bus.bus'].sudo().search([], limit=1, order='id desc').id
+
+    @api.model
+    def get_dashboard_data(self, days=7):
+        """Return the dashboard KPIs computed with grouped queries.
+
+        Counts come from ``_read_group`` on open and recent records instead of
+        loading persons and attendance rows, so the payload size only depends
+        on the number of locations, person types and ``days``.
+        """
+        Person = self.env['extended.attendance.person']
+        today = fields.Date.context_today(self)
+        # check_in is stored in UTC: start at the user's local midnight
+        tz = self.env.context.get('tz')
+        tz = pytz.timezone(tz if tz in pytz.all_timezones_set else 'UTC')
+        first_day_start = tz.localize(
+            datetime.combine(today - timedelta(days=days - 1), datetime.min.time())
+        ).astimezone(pytz.utc).replace(tzinfo=None)
+        open_domain = [('check_out', '=', False)]
+
+        occupancy = {
+            location.id: count
+            for location, count in self._read_group(open_domain, ['location_id'], ['__count'])
+        }
+        checked_in_by_type = {
+            person_type.id: count
+            for person_type, count in self._read_group(open_domain, ['person_type_id'], ['__count'])
+        }
+        persons_by_type = {
+            person_type.id: count
+            for person_type, count in Person._read_group([], ['person_type_id'], ['__count'])
+        }
+        daily = self._read_group(
+            [('check_in', '>=', first_day_start)],
+            ['check_in:day'], ['__count', 'worked_hours:sum'],
+        )
+
+        locations = self.env['attendance.location'].search_read(
+            [('active', '=', True)], ['name', 'code', 'capacity'], order='level, sequence, name'
+        )
+        person_types = self.env['person.type'].search_read([], ['name', 'code'])
+
+        daily_data = [{
+            'date': fields.Date.to_string(day),
+            'check_ins': count,
+            'worked_hours': round(worked_hours or 0.0, 2),
+        } for day, count, worked_hours in daily]
+        today_row = next((row for row in daily_data if row['date'] == fields.Date.to_string(today)), {})
+
+        return {
+            'totals': {
+                'persons': sum(persons_by_type.values()),
+                'locations': len(locations),
+                'checked_in': sum(occupancy.values()),
+                'today_check_ins': today_row.get('check_ins', 0),
+                'today_worked_hours': today_row.get('worked_hours', 0.0),
+            },
+            'locations': [{
+                'id': location['id'],
+                'name': location['name'],
+                'code': location['code'],
+                'capacity': location['capacity'],
+                'occupancy': occupancy.get(location['id'], 0),
+            } for location in locations],
+            'person_types': [{
+                'id': person_type['id'],
+                'name': person_type['name'],
+                'code': person_type['code'],
+                'persons': persons_by_type.get(person_type['id'], 0),
+                'checked_in': checked_in_by_type.get(person_type['id'], 0),
+            } for person_type in person_types],
+            'daily': daily_data,
+            'generated_at': fields.Datetime.to_string(fields.Datetime.now()),
+        }
+
+    @api.model
+    def get_attendance_report(self, date_from, date_to, location_code=None, person_type_code=None,
+                              group_by=None, limit=None, offset=0):
+        """Generate attendance report for a date range.
+
+        Statistics are aggregated by PostgreSQL, so only the requested page
+        of detail records (``limit``/``offset``, all of them by default) is
+        loaded. With ``group_by`` set to one of :data:`REPORT_GROUPS` the
+        result also holds the same statistics per day, week, month,
+        location, person type or person.
+
+        Archived records are included: the page is split into ``records``
+        and ``archived_records``, both ordered by ``check_in`` descending.
+        """
         domain = [
             ('check_in', '>=', date_from),
             ('check_in', '<=', date_to)
@@ -316,23 +632,114 @@ class ExtendedAttendanceRecord(models.Model):
             if person_type:
                 domain.append(('person_type_id', '=', person_type.id))
         
-        records = self.search(domain, order='check_in desc')
-        
-        # Calculate statistics
-        total_records = len(records)
-        total_hours = sum(records.mapped('worked_hours'))
-        avg_hours = total_hours / total_records if total_records > 0 else 0
-        
-        return {
+        records, archived_records = self._search_with_archive(domain, limit=limit, offset=offset)
+        statistics = self._get_report_statistics(domain)[0]
+        del statistics['key'], statistics['label']
+        statistics.update(date_from=date_from, date_to=date_to)
+
+        result = {
             'records': records,
-            'statistics': {
-                'total_records': total_records,
-                'total_hours': total_hours,
-                'average_hours': avg_hours,
-                'date_from': date_from,
-                'date_to': date_to
-            }
+            'archived_records': archived_records,
+            'statistics': statistics
         }
+        if group_by:
+            result['groups'] = self._get_report_statistics(domain, group_by)
+        return result
+
+    @api.model
+    def _get_union_query(self, domain, columns):
+        """Return the ``SQL`` selecting ``columns`` of the live and archived
+        records matching ``domain``, plus an ``archived`` flag"""
+        sources = []
+        for model in (self, self.env['extended.attendance.record.archive']):
+            model.flush_model(columns)
+            query = model._where_calc(domain)
+            model._apply_ir_rules(query, 'read')
+            sources.append(query.select(
+                *(SQL.identifier(model._table, column) for column in columns),
+                SQL('%s AS archived', model._name != self._name),
+            ))
+        return SQL(' UNION ALL ').join(sources)
+
+    @api.model
+    def _search_with_archive(self, domain, limit=None, offset=0):
+        """Return the live and archived records matching ``domain`` on one
+        page ordered by ``check_in`` and id descending, as two recordsets"""
+        self.env.cr.execute(SQL("""
+            SELECT id, archived FROM (%s) r
+          ORDER BY check_in DESC, id DESC
+             LIMIT %s OFFSET %s
+        """, self._get_union_query(domain, ['id', 'check_in']), limit, offset or 0))
+        rows = self.env.cr.fetchall()
+        return (
+            self.browse([record_id for record_id, archived in rows if not archived]),
+            self.env['extended.attendance.record.archive'].browse([record_id for record_id, archived in rows if archived]),
+        )
+
+    @api.model
+    def _get_report_statistics(self, domain, group_by=None):
+        """Aggregate the records matching ``domain`` in a single query.
+
+        Live and archived records are aggregated together. Returns one
+        dict per group (a single one without ``group_by``) with
+        the record count, distinct persons, total/average hours and the
+        median, 90th percentile and maximum duration of completed visits.
+        """
+        if group_by and group_by not in REPORT_GROUPS:
+            raise UserError(_('Invalid report grouping: %s') % group_by)
+
+        if not group_by:
+            group_expr = SQL('NULL')
+        elif group_by in ('day', 'week', 'month'):
+            # Bucket in the user's timezone, like read_group does
+            tz = self.env.context.get('tz')
+            group_expr = SQL("date_trunc(%s, timezone(%s, timezone('UTC', r.check_in)))",
+                             group_by, tz if tz in pytz.all_timezones_set else 'UTC')
+        else:
+            group_expr = SQL.identifier('r', REPORT_GROUPS[group_by])
+
+        self.env.cr.execute(SQL("""
+            SELECT %s AS report_group,
+                   count(*),
+                   count(DISTINCT r.person_id),
+                   coalesce(sum(r.worked_hours), 0),
+                   percentile_cont(0.5) WITHIN GROUP (ORDER BY r.worked_hours)
+                       FILTER (WHERE r.check_out IS NOT NULL),
+                   percentile_cont(0.9) WITHIN GROUP (ORDER BY r.worked_hours)
+                       FILTER (WHERE r.check_out IS NOT NULL),
+                   max(r.worked_hours)
+              FROM (%s) r
+          GROUP BY report_group
+          ORDER BY report_group
+        """, group_expr, self._get_union_query(domain, REPORT_COLUMNS)))
+        rows = self.env.cr.fetchall()
+        if not group_by and not rows:
+            rows = [(None, 0, 0, 0.0, None, None, None)]
+
+        labels = {}
+        if group_by in ('location', 'person_type', 'person'):
+            comodel = self._fields[REPORT_GROUPS[group_by]].comodel_name
+            labels = {
+                record.id: record.display_name
+                for record in self.env[comodel].browse([row[0] for row in rows if row[0]])
+            }
+
+        groups = []
+        for key, count, persons, total_hours, median_hours, p90_hours, max_hours in rows:
+            if group_by in ('day', 'week', 'month'):
+                key = fields.Date.to_string(key)
+            groups.append({
+                'key': key,
+                'label': labels.get(key, key) if group_by else None,
+                'total_records': count,
+                'unique_persons': persons,
+                'total_hours': total_hours,
+                'average_hours': total_hours / count if count else 0,
+                'median_hours': median_hours or 0.0,
+                'p90_hours': p90_hours or 0.0,
+                'max_hours': max_hours or 0.0,
+            })
+        return groups
 
 
 # Extend the original hr.attendance model to maintain compatibility
@@ -346,6 +753,13 @@ class HrAttendance(models.Model):
         help='Link to extended attendance record'
     )
     
+    # Extended record moved to the archive, which unlinks it from the punch
+    archived_record_ids = fields.One2many(
+        'extended.attendance.record.archive',
+        'hr_attendance_id',
+        string='Archived Extended Records'
+    )
+    
     # Location information
     location_id = fields.Many2one(
         'attendance.location',
@@ -353,36 +767,83 @@ class HrAttendance(models.Model):
         help='Location where attendance was recorded'
     )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Override create to potentially create extended records"""
+        records = super().create(vals_list)
+        records._create_extended_records()
+        return records
+
+    def write(self, vals):
+        """Override write to keep the linked extended records in sync"""
+        res = super().write(vals)
+        extended_vals = {name: vals[name] for name in HR_SYNC_FIELDS if name in vals}
+        if extended_vals.get('location_id') is False:
+            del extended_vals['location_id']
+        if extended_vals and self.extended_record_id:
+            self.extended_record_id.write(extended_vals)
+        return res
+
+    def _create_extended_records(self):
+        """Create the extended records of employees that have an extended person.
+
+        Persons are matched for the whole batch in one query, all
+        extended records are created with a single ``create`` call and
+        linked back to the attendances with a single ``UPDATE``.
+        """
+        attendances = self.filtered('employee_id')
+        if not attendances:
+            return
+
+        person_by_employee = {}
+        for person in self.env['extended.attendance.person'].search_read(
+            [('employee_id', 'in', attendances.employee_id.ids)], ['employee_id']
+        ):
+            person_by_employee.setdefault(person['employee_id'][0], person['id'])
+        attendances = attendances.filtered(lambda a: a.employee_id.id in person_by_employee)
+        if not attendances:
+            return
+
+        default_location_id = None
+        extended_vals_list = []
+        for attendance in attendances:
+            location_id = attendance.location_id.id
+            if not location_id:
+                default_location_id = default_location_id or self._get_default_location().id
+                location_id = default_location_id
+            extended_vals_list.append({
+                'person_id': person_by_employee[attendance.employee_id.id],
+                'location_id': location_id,
+                'check_in': attendance.check_in,
+                'check_out': attendance.check_out,
+            })
+
+        extended_records = self.env['extended.attendance.record'].create(extended_vals_list)
+        # Link the whole batch back with one UPDATE instead of one per attendance
+        self.env.cr.execute(f"""
+            UPDATE {self._table} h SET extended_record_id = v.record_id
+              FROM unnest(%s::int[], %s::int[]) AS v(attendance_id, record_id)
+             WHERE h.id = v.attendance_id
+        """, [attendances.ids, extended_records.ids])
+        attendances.invalidate_recordset(['extended_record_id'])
+
     @api.model
-    def create(self, vals):
-        """Override create to potentially create extended record"""
-        record = super().create(vals)
-        
-        # If employee has an extended person record, create extended attendance
-        if record.employee_id:
-            extended_person = self.env['extended.attendance.person'].search([
-                ('employee_id', '=', record.employee_id.id)
-            ], limit=1)
-            
-            if extended_person:
-                # Create extended attendance record
-                extended_vals = {
-                    'person_id': extended_person.id,
-                    'location_id': vals.get('location_id') or self._get_default_location().id,
-                    'check_in': record.check_in,
-                    'check_out': record.check_out,
-                }
-                
-                extended_record = self.env['extended.attendance.record'].create(extended_vals)
-                record.extended_record_id = extended_record.id
-        
-        return record
+    def _get_default_location_id(self):
+        """Id of the default location, cached until locations are created,
+        deleted or recoded"""
+        return self._find_default_location_id(get_version(self.env.cr, LOCATION_CODE_VERSION))
+
+    @api.model
+    @tools.ormcache('version')
+    def _find_default_location_id(self, version):
+        """Search the default location for location code ``version``"""
+        return self.env['attendance.location'].sudo().search([
+            ('code', '=', 'MAIN_ENT')
+        ], limit=1).id
 
     def _get_default_location(self):
         """Get default location for HR attendance records"""
-        default_location = self.env['attendance.location'].search([
-            ('code', '=', 'MAIN_ENT')
-        ], limit=1)
+        default_location = self.env['attendance.location'].browse(self._get_default_location_id())
 
         if not default_location:
             # Create a default location if it doesn't exist
@@ -393,3 +854,61 @@ class HrAttendance(models.Model):
             })
         
         return default_location
+
+    @api.model
+    def _cron_reconcile_extended_records(self):
+        """Backfill and resync extended records of HR attendances.
+
+        Unlinked attendances of employees with an extended person, except
+        those whose extended record was archived, get their extended records
+        created ``HR_SYNC_BATCH_SIZE`` at a time; linked
+        pairs whose times differ are found with one join and the extended
+        side is updated. Each batch is committed, and a batch that fails
+        validation is retried row by row so one bad punch doesn't block
+        the others.
+        """
+        employee_ids = self.env['extended.attendance.person'].search([
+            ('employee_id', '!=', False)
+        ]).employee_id.ids
+        failed_ids = []
+        while True:
+            attendances = self.search([
+                ('extended_record_id', '=', False),
+                ('archived_record_ids', '=', False),
+                ('employee_id', 'in', employee_ids),
+                ('id', 'not in', failed_ids),
+            ], order='id', limit=HR_SYNC_BATCH_SIZE)
+            if not attendances:
+                break
+            try:
+                with self.env.cr.savepoint():
+                    attendances._create_extended_records()
+            except (ValidationError, UserError):
+                for attendance in attendances:
+                    try:
+                        with self.env.cr.savepoint():
+                            attendance._create_extended_records()
+                    except (ValidationError, UserError) as e:
+                        _logger.warning("Could not bridge hr.attendance %s: %s", attendance.id, e)
+                        failed_ids.append(attendance.id)
+            self.env.cr.commit()
+
+        self.flush_model(['check_in', 'check_out', 'extended_record_id'])
+        self.env['extended.attendance.record'].flush_model(['check_in', 'check_out'])
+        self.env.cr.execute("""
+            SELECT h.id
+              FROM hr_attendance h
+              JOIN extended_attendance_record e ON e.id = h.extended_record_id
+             WHERE h.check_in IS DISTINCT FROM e.check_in
+                OR h.check_out IS DISTINCT FROM e.check_out
+        """)
+        for attendance in self.browse([row[0] for row in self.env.cr.fetchall()]):
+            try:
+                with self.env.cr.savepoint():
+                    attendance.extended_record_id.write({
+                        'check_in': attendance.check_in,
+                        'check_out': attendance.check_out,
+                    })
+            except (ValidationError, UserError) as e:
+                _logger.warning("Could not resync hr.attendance %s: %s", attendance.id, e)
+        return True
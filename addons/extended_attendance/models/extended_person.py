@@ -1,6 +1,34 @@
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError, UserError
+from .access_version import PERSON_ACCESS_VERSION, get_version, bump_version
+import base64
+import csv
+import io
 import json
+import psycopg2
+
+
+# Columns accepted by import_persons; person types are given by code
+# (person_type) or id (person_type_id)
+IMPORT_COLUMNS = [
+    'person_id', 'name', 'first_name', 'last_name', 'person_type', 'person_type_id',
+    'barcode', 'rfid_tag', 'qr_code', 'email', 'phone', 'mobile',
+    'start_date', 'end_date', 'access_level', 'custom_fields',
+]
+IMPORT_DATE_COLUMNS = ('start_date', 'end_date')
+
+# Columns written by import_persons from the staging table
+IMPORT_WRITE_COLUMNS = [
+    'name', 'first_name', 'last_name', 'barcode', 'rfid_tag', 'qr_code',
+    'email', 'phone', 'mobile', 'start_date', 'end_date',
+]
+
+# Staged rows inserted or updated per statement by import_persons
+IMPORT_CHUNK_SIZE = 5000
+
+# Thumbnail sizes (square, in pixels) served to API clients
+THUMBNAIL_SIZES = (64, 128, 256)
+DEFAULT_THUMBNAIL_SIZE = 128
 
 
 class ExtendedPerson(models.Model):
@@ -9,6 +37,9 @@ class ExtendedPerson(models.Model):
     _order = 'name'
     _rec_name = 'name'
 
+    # Fields feeding the compiled access matrix (see _get_person_access_map)
+    _ACCESS_MATRIX_FIELDS = {'active', 'end_date', 'person_type_id', 'allowed_location_ids'}
+
     # Basic Information
     name = fields.Char(
         string='Full Name',
@@ -102,20 +133,20 @@ class ExtendedPerson(models.Model):
         help='Photo of the person'
     )
     
+    # Resized when read instead of being stored next to the photo; API
+    # clients use the cached thumbnails of get_thumbnail instead
     image_medium = fields.Image(
         string='Medium Photo',
         related='image',
         max_width=128,
-        max_height=128,
-        store=True
+        max_height=128
     )
     
     image_small = fields.Image(
         string='Small Photo',
         related='image',
         max_width=64,
-        max_height=64,
-        store=True
+        max_height=64
     )
     
     # Access Control
@@ -144,11 +175,26 @@ class ExtendedPerson(models.Model):
         help='Link to existing HR employee record'
     )
     
-    # Custom Fields Storage
+    # Custom Fields Storage, a jsonb column indexed for containment searches
+    custom_field_values = fields.Json(
+        string='Custom Field Values',
+        help='Values of the custom fields, keyed by technical name'
+    )
+
+    # Text view of the values, edited from the form
     custom_fields_json = fields.Text(
         string='Custom Fields JSON',
+        compute='_compute_custom_fields_json',
+        inverse='_inverse_custom_fields_json',
         help='JSON storage for custom fields'
     )
+
+    # Filter on custom fields, e.g. ('custom_field_filter', '=', {'grade': 10})
+    custom_field_filter = fields.Boolean(
+        string='Custom Field Filter',
+        compute='_compute_custom_field_filter',
+        search='_search_custom_field_filter'
+    )
     
     # Statistics
     attendance_count = fields.Integer(
@@ -226,70 +272,337 @@ class ExtendedPerson(models.Model):
             if record.start_date and record.end_date and record.start_date > record.end_date:
                 raise ValidationError(_('Start date cannot be after end date.'))
 
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to handle custom fields and defaults"""
-        # Set default access level from person type
-        if 'person_type_id' in vals and 'access_level' not in vals:
-            person_type = self.env['person.type'].browse(vals['person_type_id'])
-            vals['access_level'] = person_type.default_access_level
-
-        # Set requires_approval from person type
-        if 'person_type_id' in vals and 'requires_approval' not in vals:
-            person_type = self.env['person.type'].browse(vals['person_type_id'])
-            vals['requires_approval'] = person_type.requires_approval
-        
-        return super().create(vals)
+        # Read the defaults of every person type in the batch at once
+        type_ids = {vals['person_type_id'] for vals in vals_list if vals.get('person_type_id')}
+        person_types = {
+            person_type['id']: person_type
+            for person_type in self.env['person.type'].browse(type_ids).read(
+                ['default_access_level', 'requires_approval']
+            )
+        }
+
+        for vals in vals_list:
+            person_type = person_types.get(vals.get('person_type_id'))
+            if not person_type:
+                continue
+            # Set default access level from person type
+            vals.setdefault('access_level', person_type['default_access_level'])
+            # Set requires_approval from person type
+            vals.setdefault('requires_approval', person_type['requires_approval'])
+
+        records = super().create(vals_list)
+        if any(vals.get('image') for vals in vals_list):
+            # Thumbnails of imported photos are generated in the background
+            self.env.ref('extended_attendance.ir_cron_person_thumbnails')._trigger()
+        return records
+
+    def write(self, vals):
+        """Override write to invalidate the access matrix on relevant changes,
+        to drop the thumbnails of replaced photos and to generate the new ones"""
+        old_checksums = set(self._get_image_checksums().values()) if 'image' in vals else set()
+        res = super().write(vals)
+        if self._ACCESS_MATRIX_FIELDS.intersection(vals):
+            bump_version(self.env.cr, PERSON_ACCESS_VERSION, self.env.uid)
+        if old_checksums:
+            self._unlink_thumbnails(old_checksums)
+        if vals.get('image'):
+            self.env.ref('extended_attendance.ir_cron_person_thumbnails')._trigger()
+        return res
+
+    def unlink(self):
+        """Override unlink to drop the thumbnails of the deleted photos"""
+        old_checksums = set(self._get_image_checksums().values())
+        res = super().unlink()
+        if old_checksums:
+            self._unlink_thumbnails(old_checksums)
+        return res
+
+    def init(self):
+        """Index the custom field values and move legacy text values into them,
+        and drop the attachments of the formerly stored resized photos"""
+        self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name), ('res_field', 'in', ['image_medium', 'image_small'])
+        ]).unlink()
+        # The default jsonb_ops operator class serves both @> and ?|, which
+        # the former jsonb_path_ops index could not
+        self._cr.execute("DROP INDEX IF EXISTS extended_attendance_person_custom_field_values_idx")
+        tools.create_index(
+            self._cr, 'extended_attendance_person_custom_field_values_gin_idx',
+            self._table, ['custom_field_values'], method='gin'
+        )
+        # custom_fields_json used to be a stored text column
+        if tools.column_exists(self._cr, self._table, 'custom_fields_json'):
+            self._cr.execute(f"""
+                SELECT id, custom_fields_json FROM {self._table}
+                 WHERE custom_field_values IS NULL AND custom_fields_json IS NOT NULL
+            """)
+            for person_id, text in self._cr.fetchall():
+                try:
+                    values = json.loads(text)
+                except ValueError:
+                    values = None
+                self._cr.execute(f"""
+                    UPDATE {self._table} SET custom_field_values = %s, custom_fields_json = NULL WHERE id = %s
+                """, [json.dumps(values if isinstance(values, dict) else {}), person_id])
+
+    @api.depends('custom_field_values')
+    def _compute_custom_fields_json(self):
+        """Show the custom field values as indented JSON text"""
+        for record in self:
+            record.custom_fields_json = json.dumps(record.custom_field_values, indent=2) if record.custom_field_values else False
+
+    def _inverse_custom_fields_json(self):
+        """Parse the edited JSON text back into the custom field values"""
+        for record in self:
+            try:
+                values = json.loads(record.custom_fields_json) if record.custom_fields_json else {}
+            except ValueError:
+                raise ValidationError(_('Custom fields must be valid JSON.'))
+            if not isinstance(values, dict):
+                raise ValidationError(_('Custom fields must be a JSON object.'))
+            record.custom_field_values = values
+
+    def _compute_custom_field_filter(self):
+        for record in self:
+            record.custom_field_filter = False
+
+    def _search_custom_field_filter(self, operator, value):
+        """Search custom field values in SQL using the GIN index, which
+        serves both the ``@>`` and ``?|`` operators.
+
+        ``=`` matches persons whose values contain the given dict, ``in``
+        matches persons having any of the given custom fields set.
+        """
+        if operator == '=' and isinstance(value, dict):
+            condition, param = 'custom_field_values @> %s::jsonb', json.dumps(value)
+        elif operator == 'in' and isinstance(value, (list, tuple)):
+            condition, param = 'custom_field_values ?| %s', list(value)
+        else:
+            raise UserError(_('Unsupported custom field filter: %s %s') % (operator, value))
+        return [('id', 'inselect', (f'SELECT id FROM {self._table} WHERE {condition}', [param]))]
+
+    def _get_image_checksums(self):
+        """Map person ids to the checksum of their photo attachment"""
+        attachments = self.env['ir.attachment'].sudo().search_read([
+            ('res_model', '=', self._name), ('res_field', '=', 'image'), ('res_id', 'in', self.ids)
+        ], ['res_id', 'checksum'])
+        return {attachment['res_id']: attachment['checksum'] for attachment in attachments}
+
+    @api.model
+    def _get_thumbnail_attachment(self, checksum, size):
+        """Return the stored thumbnail of the photo with ``checksum``, if any.
+
+        Thumbnails are attachments named after the photo checksum and size,
+        so persons sharing a photo share its thumbnails and a new photo never
+        hits a stale one.
+        """
+        return self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name), ('res_id', '=', 0), ('name', '=', f'thumbnail_{size}_{checksum}'),
+        ], limit=1)
+
+    @api.model
+    def _render_thumbnail(self, checksum, size):
+        """Return the raw thumbnail and mimetype of the photo with ``checksum``"""
+        original = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name), ('res_field', '=', 'image'), ('checksum', '=', checksum),
+        ], limit=1)
+        return tools.image_process(original.raw, size=(size, size)), original.mimetype
+
+    def get_thumbnail(self, size=DEFAULT_THUMBNAIL_SIZE):
+        """Return ``{checksum, mimetype, datas}`` of this person's photo
+        thumbnail, ``checksum`` being the photo's and ``datas`` base64, or
+        False without a photo.
+
+        Only reads: a thumbnail the background generation has not stored yet
+        is resized in memory and not saved.
+        """
+        self.ensure_one()
+        size = int(size)
+        if size not in THUMBNAIL_SIZES:
+            raise UserError(_('Thumbnail size must be one of %s.') % ', '.join(map(str, THUMBNAIL_SIZES)))
+        checksum = self._get_image_checksums().get(self.id)
+        if not checksum:
+            return False
+        thumbnail = self._get_thumbnail_attachment(checksum, size)
+        if thumbnail:
+            raw, mimetype = thumbnail.raw, thumbnail.mimetype
+        else:
+            raw, mimetype = self._render_thumbnail(checksum, size)
+        return {
+            'checksum': checksum,
+            'mimetype': mimetype,
+            'datas': base64.b64encode(raw).decode('ascii'),
+        }
+
+    @api.model
+    def _cron_generate_thumbnails(self):
+        """Store the missing thumbnails of every photo, e.g. after an import,
+        then delete the thumbnails of photos no longer used by any person"""
+        self.env['ir.attachment'].flush_model(['res_model', 'res_field', 'res_id', 'name', 'checksum'])
+        self.env.cr.execute("""
+            SELECT DISTINCT checksum FROM ir_attachment
+             WHERE res_model = %s AND res_field = 'image' AND checksum IS NOT NULL
+        """, [self._name])
+        checksums = [row[0] for row in self.env.cr.fetchall()]
+        existing = set(self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name), ('res_id', '=', 0), ('name', '=like', 'thumbnail_%'),
+        ]).mapped('name'))
+        Attachment = self.env['ir.attachment'].sudo()
+        for checksum in checksums:
+            for size in THUMBNAIL_SIZES:
+                name = f'thumbnail_{size}_{checksum}'
+                if name not in existing:
+                    raw, _mimetype = self._render_thumbnail(checksum, size)
+                    Attachment.create({'name': name, 'res_model': self._name, 'res_id': 0, 'raw': raw})
+            self.env.cr.commit()
+
+        # Photos replaced or deleted outside the ORM leave thumbnails behind
+        self._unlink_thumbnails()
+        return True
+
+    @api.model
+    def _unlink_thumbnails(self, checksums=None):
+        """Delete the thumbnails of ``checksums`` (of every photo by default)
+        that no longer belong to any person's photo"""
+        self.env['ir.attachment'].flush_model(['res_model', 'res_field', 'res_id', 'name', 'checksum'])
+        self.env.cr.execute("""
+            SELECT t.id FROM ir_attachment t
+             WHERE t.res_model = %(model)s AND t.res_id = 0 AND t.name LIKE 'thumbnail\\_%%'
+               AND (%(all)s OR split_part(t.name, '_', 3) = ANY(%(checksums)s))
+               AND NOT EXISTS (
+                   SELECT 1 FROM ir_attachment a
+                    WHERE a.res_model = %(model)s AND a.res_field = 'image'
+                      AND a.checksum = split_part(t.name, '_', 3)
+               )
+        """, {'model': self._name, 'all': checksums is None, 'checksums': list(checksums or ())})
+        thumbnail_ids = [row[0] for row in self.env.cr.fetchall()]
+        self.env['ir.attachment'].sudo().browse(thumbnail_ids).unlink()
 
     def get_custom_field_value(self, field_name):
         """Get value of a custom field"""
         self.ensure_one()
-        if not self.custom_fields_json:
-            return None
-        
-        try:
-            custom_fields = json.loads(self.custom_fields_json)
-            return custom_fields.get(field_name)
-        except (json.JSONDecodeError, TypeError):
-            return None
+        return (self.custom_field_values or {}).get(field_name)
 
     def set_custom_field_value(self, field_name, value):
         """Set value of a custom field"""
         self.ensure_one()
-        
-        try:
-            custom_fields = json.loads(self.custom_fields_json) if self.custom_fields_json else {}
-        except (json.JSONDecodeError, TypeError):
-            custom_fields = {}
-        
-        custom_fields[field_name] = value
-        self.custom_fields_json = json.dumps(custom_fields)
+        self.custom_field_values = dict(self.custom_field_values or {}, **{field_name: value})
+
+    @api.model
+    def _get_person_access_map(self):
+        """Return the compiled person -> location access map.
+
+        Maps every person id to ``(active, end_date, person_type_id,
+        allowed_location_ids)`` where ``allowed_location_ids`` is a frozenset,
+        or None when the person is not restricted to specific locations.
+
+        The result is cached per worker and rebuilt whenever a person's
+        access-related fields change, which bumps its version. Persons
+        created since are missing from it and read from the database instead
+        (see ``_get_person_access``), and deleted ones are never looked up
+        again.
+        """
+        return self._build_person_access_map(get_version(self.env.cr, PERSON_ACCESS_VERSION))
+
+    @api.model
+    @tools.ormcache('version')
+    def _build_person_access_map(self, version):
+        """Compile the person access map of access data ``version``"""
+        self.flush_model(list(self._ACCESS_MATRIX_FIELDS))
+        field = self._fields['allowed_location_ids']
+
+        self.env.cr.execute(f"""
+            SELECT {field.column1}, {field.column2} FROM {field.relation}
+        """)
+        allowed_locations = {}
+        for person_id, location_id in self.env.cr.fetchall():
+            allowed_locations.setdefault(person_id, set()).add(location_id)
+
+        self.env.cr.execute(f"SELECT id, active, end_date, person_type_id FROM {self._table}")
+        return {
+            person_id: (
+                active,
+                end_date,
+                person_type_id,
+                frozenset(allowed_locations[person_id]) if person_id in allowed_locations else None,
+            )
+            for person_id, active, end_date, person_type_id in self.env.cr.fetchall()
+        }
+
+    @api.model
+    def _get_person_access(self, person_map, person_id):
+        """Return the access tuple of a person from ``person_map``, reading
+        persons created after the map was compiled from the database"""
+        if person_id in person_map:
+            return person_map[person_id]
+        person = self.with_context(active_test=False).browse(person_id).exists()
+        if not person:
+            return None
+        return (
+            person.active,
+            person.end_date,
+            person.person_type_id.id,
+            frozenset(person.allowed_location_ids.ids) if person.allowed_location_ids else None,
+        )
+
+    @api.model
+    def check_location_access_batch(self, events):
+        """Check location access for many ``(person_id, location_id)`` pairs.
+
+        Uses the compiled access matrices, so validating a batch only costs
+        set lookups plus one operating-hours check per scheduled location.
+        Returns a list of ``(allowed, message)`` tuples in the order of ``events``.
+        """
+        Location = self.env['attendance.location']
+        person_map = self._get_person_access_map()
+        type_locations, restricted_location_ids, scheduled_location_ids = Location._get_location_access_map()
+        today = fields.Date.today()
+        operating = {}
+
+        results = []
+        for person_id, location_id in events:
+            person_access = self._get_person_access(person_map, person_id)
+            if person_access is None:
+                results.append((False, _('Person not found')))
+                continue
+
+            active, end_date, person_type_id, allowed_location_ids = person_access
+
+            # Check if person is active
+            if not active:
+                results.append((False, _('Person is inactive')))
+
+            # Check if person has ended
+            elif end_date and today > end_date:
+                results.append((False, _('Person access has expired')))
+
+            # Check location access permissions
+            elif (location_id in restricted_location_ids
+                  and location_id not in type_locations.get(person_type_id, ())):
+                results.append((False, _('Person type not allowed at this location')))
+
+            # Check if person has specific location restrictions
+            elif allowed_location_ids is not None and location_id not in allowed_location_ids:
+                results.append((False, _('Person not authorized for this location')))
+
+            # Check if location is currently operating
+            else:
+                if location_id in scheduled_location_ids and location_id not in operating:
+                    operating[location_id] = Location.browse(location_id).is_operating_now()
+                if not operating.get(location_id, True):
+                    results.append((False, _('Location is not currently operating')))
+                else:
+                    results.append((True, _('Access granted')))
+
+        return results
 
     def check_location_access(self, location):
         """Check if person has access to a specific location"""
         self.ensure_one()
-        
-        # Check if person is active
-        if not self.active:
-            return False, _('Person is inactive')
-        
-        # Check if person has ended
-        if self.end_date and fields.Date.today() > self.end_date:
-            return False, _('Person access has expired')
-        
-        # Check location access permissions
-        if not location.check_access_permission(self):
-            return False, _('Person type not allowed at this location')
-        
-        # Check if person has specific location restrictions
-        if self.allowed_location_ids and location not in self.allowed_location_ids:
-            return False, _('Person not authorized for this location')
-        
-        # Check if location is currently operating
-        if not location.is_operating_now():
-            return False, _('Location is not currently operating')
-        
-        return True, _('Access granted')
+        return self.check_location_access_batch([(self.id, location.id)])[0]
 
     def create_attendance_record(self, location, check_in_time=None, device=None, auto_action='manual'):
         """Create an attendance record for this person with hierarchical logic"""
@@ -498,6 +811,70 @@ class ExtendedPerson(models.Model):
             'context': {'default_person_id': self.id},
         }
 
+    @api.model
+    def get_directory(self, domain=None, custom_fields=None):
+        """Return persons with their type and current location in one call.
+
+        Types, open attendance records and locations are each fetched with a
+        single batched query and joined in memory, instead of one round trip
+        per person. ``custom_fields`` lists the custom field technical names
+        to include in each row.
+        """
+        read_fields = ['name', 'person_id', 'person_type_id', 'email', 'phone', 'active']
+        if custom_fields:
+            read_fields.append('custom_field_values')
+        persons = self.search_read(domain or [], read_fields)
+        image_checksums = self.browse([person['id'] for person in persons])._get_image_checksums()
+
+        type_ids = {person['person_type_id'][0] for person in persons if person['person_type_id']}
+        person_types = {
+            person_type['id']: {'name': person_type['name'], 'code': person_type['code']}
+            for person_type in self.env['person.type'].browse(type_ids).read(['name', 'code'])
+        }
+
+        # Latest open record per person gives the current location
+        current_location_ids = {}
+        for record in self.env['extended.attendance.record'].search_read(
+            [('person_id', 'in', [person['id'] for person in persons]), ('check_out', '=', False)],
+            ['person_id', 'location_id'], order='check_in desc, id desc'
+        ):
+            current_location_ids.setdefault(record['person_id'][0], record['location_id'][0])
+
+        locations = {
+            location['id']: {'name': location['name'], 'code': location['code']}
+            for location in self.env['attendance.location'].browse(
+                set(current_location_ids.values())
+            ).read(['name', 'code'])
+        }
+
+        data = []
+        for person in persons:
+            location_id = current_location_ids.get(person['id'], False)
+            row = {
+                'id': person['id'],
+                'name': person['name'],
+                'person_id': person['person_id'],
+                'person_type': person_types.get(
+                    person['person_type_id'] and person['person_type_id'][0], {'name': '', 'code': ''}
+                ),
+                'is_checked_in': bool(location_id),
+                'current_location': locations.get(location_id, False),
+                'email': person['email'] or '',
+                'phone': person['phone'] or '',
+                'active': person['active'],
+                # The checksum makes the URL change with the photo, so it can be cached forever
+                'thumbnail_url': image_checksums.get(person['id']) and (
+                    f"/api/attendance/persons/{person['id']}/thumbnail/{DEFAULT_THUMBNAIL_SIZE}"
+                    f"?v={image_checksums[person['id']][:12]}"
+                ) or False
+            }
+            if custom_fields:
+                values = person['custom_field_values'] or {}
+                row['custom_fields'] = {name: values.get(name, False) for name in custom_fields}
+            data.append(row)
+
+        return data
+
     @api.model
     def search_by_identifier(self, identifier):
         """Search person by any identifier (person_id, barcode, rfid_tag, qr_code)"""
@@ -509,3 +886,204 @@ class ExtendedPerson(models.Model):
             ('qr_code', '=', identifier)
         ]
         return self.search(domain, limit=1)
+
+    @api.model
+    def _parse_import_rows(self, data, file_format):
+        """Return ``(rows, errors)`` from CSV or NDJSON ``data``.
+
+        Rows are dicts of :data:`IMPORT_COLUMNS` with their source line
+        number under ``line``; empty values become None and lines that
+        can't be parsed are reported in ``errors``.
+        """
+        if file_format == 'csv':
+            reader = csv.DictReader(io.StringIO(data))
+            # Header is line 1
+            raw_rows = ((reader.line_num, row) for row in reader)
+        elif file_format == 'ndjson':
+            raw_rows = []
+            for line, text in enumerate(data.splitlines(), 1):
+                if text.strip():
+                    try:
+                        raw_rows.append((line, json.loads(text)))
+                    except ValueError as e:
+                        raw_rows.append((line, str(e)))
+        else:
+            raise UserError(_('Invalid import format: %s') % file_format)
+
+        rows, errors = [], []
+        for line, raw in raw_rows:
+            if not isinstance(raw, dict):
+                errors.append({'line': line, 'person_id': False, 'error': _('Invalid row: %s') % raw})
+                continue
+            row = {column: raw.get(column) if raw.get(column) not in ('', None) else None for column in IMPORT_COLUMNS}
+            row['line'] = line
+            try:
+                for column in IMPORT_DATE_COLUMNS:
+                    if row[column] is not None:
+                        row[column] = fields.Date.to_string(fields.Date.to_date(row[column]))
+                if row['person_type_id'] is not None:
+                    row['person_type_id'] = int(row['person_type_id'])
+                if isinstance(row['custom_fields'], str):
+                    row['custom_fields'] = json.loads(row['custom_fields'])
+                if row['custom_fields'] is not None and not isinstance(row['custom_fields'], dict):
+                    raise ValueError(_('Custom fields must be a JSON object.'))
+            except (TypeError, ValueError) as e:
+                errors.append({'line': line, 'person_id': row['person_id'] or False, 'error': str(e)})
+                continue
+            rows.append(row)
+        return rows, errors
+
+    @api.model
+    def import_persons(self, data, file_format='csv', update_existing=True):
+        """Create or update persons in bulk from CSV or NDJSON ``data``.
+
+        Rows are loaded into a temporary staging table with one statement,
+        then validated with set-based SQL: required columns, person types,
+        dates, access levels and the uniqueness of person IDs, barcodes, RFID
+        tags and QR codes, within the file and against existing persons. The
+        name is only required for new persons. Valid rows
+        are inserted, or update the person with the same person ID when
+        ``update_existing`` is set, ``IMPORT_CHUNK_SIZE`` rows per statement.
+
+        Returns ``{total, created, updated, errors}`` where ``errors`` lists
+        the ``line``, ``person_id`` and ``error`` of every rejected row.
+        """
+        self.check_access_rights('create')
+        if update_existing:
+            self.check_access_rights('write')
+
+        rows, errors = self._parse_import_rows(data, file_format)
+        total = len(rows) + len(errors)
+        cr = self.env.cr
+        self.flush_model()
+        self.env['person.type'].flush_model()
+
+        cr.execute("DROP TABLE IF EXISTS extended_attendance_person_import")
+        cr.execute("""
+            CREATE TEMPORARY TABLE extended_attendance_person_import (
+                line integer PRIMARY KEY,
+                person_id varchar, name varchar, first_name varchar, last_name varchar,
+                person_type varchar, person_type_id integer,
+                barcode varchar, rfid_tag varchar, qr_code varchar,
+                email varchar, phone varchar, mobile varchar,
+                start_date date, end_date date, access_level varchar, custom_fields jsonb,
+                existing_id integer, error varchar
+            )
+        """)
+        cr.execute("""
+            INSERT INTO extended_attendance_person_import
+            SELECT * FROM jsonb_populate_recordset(NULL::extended_attendance_person_import, %s)
+        """, [json.dumps(rows)])
+        cr.execute("ANALYZE extended_attendance_person_import")
+
+        access_levels = [value for value, label in self._fields['access_level'].selection]
+        checks = [
+            (_('Person ID is required.'), "s.person_id IS NULL", {}),
+            # Updated persons keep their name when the row leaves it empty
+            (_('Name is required.'), "s.name IS NULL AND s.existing_id IS NULL", {}),
+            (_('Unknown person type.'), """
+                s.person_type_id IS NULL OR NOT EXISTS (SELECT 1 FROM person_type pt WHERE pt.id = s.person_type_id)
+            """, {}),
+            (_('Start date cannot be after end date.'), "s.start_date > s.end_date", {}),
+            (_('Invalid access level.'), "s.access_level <> ALL(%(access_levels)s)", {'access_levels': access_levels}),
+            (_('Person ID already exists.'), "s.existing_id IS NOT NULL AND NOT %(update_existing)s",
+             {'update_existing': bool(update_existing)}),
+        ]
+        unique_columns = (
+            ('person_id', _('Person ID')), ('barcode', _('Barcode')),
+            ('rfid_tag', _('RFID tag')), ('qr_code', _('QR code')),
+        )
+        for column, label in unique_columns:
+            checks += [
+                (_('%s is repeated in the file.') % label, f"""
+                    s.{column} IS NOT NULL AND EXISTS (
+                        SELECT 1 FROM extended_attendance_person_import o WHERE o.{column} = s.{column} AND o.line < s.line
+                    )
+                """, {}),
+                (_('%s already exists.') % label, f"""
+                    s.{column} IS NOT NULL AND EXISTS (
+                        SELECT 1 FROM {self._table} p
+                         WHERE p.{column} = s.{column} AND p.id IS DISTINCT FROM s.existing_id
+                    )
+                """, {}),
+            ]
+
+        # Resolve person types by code and match existing persons, archived ones included
+        cr.execute("""
+            UPDATE extended_attendance_person_import s SET person_type_id = pt.id
+              FROM person_type pt
+             WHERE s.person_type_id IS NULL AND pt.code = s.person_type
+        """)
+        cr.execute(f"""
+            UPDATE extended_attendance_person_import s SET existing_id = p.id
+              FROM {self._table} p
+             WHERE p.person_id = s.person_id
+        """)
+        for message, condition, params in checks:
+            cr.execute(f"""
+                UPDATE extended_attendance_person_import s SET error = %(message)s
+                 WHERE s.error IS NULL AND ({condition})
+            """, dict(params, message=message))
+
+        created = updated = 0
+        values = {'uid': self.env.uid, 'now': cr.now()}
+        cr.execute("SELECT line FROM extended_attendance_person_import WHERE error IS NULL ORDER BY line")
+        lines = [line for line, in cr.fetchall()]
+        for start in range(0, len(lines), IMPORT_CHUNK_SIZE):
+            chunk = dict(values, first=lines[start], last=lines[start:start + IMPORT_CHUNK_SIZE][-1])
+            try:
+                with cr.savepoint():
+                    cr.execute(f"""
+                        UPDATE {self._table} p
+                           SET {', '.join(f'{column} = coalesce(s.{column}, p.{column})' for column in IMPORT_WRITE_COLUMNS)},
+                               person_type_id = s.person_type_id,
+                               access_level = coalesce(s.access_level, p.access_level),
+                               custom_field_values = CASE WHEN s.custom_fields IS NULL THEN p.custom_field_values
+                                   ELSE coalesce(p.custom_field_values, '{{}}'::jsonb) || s.custom_fields END,
+                               write_uid = %(uid)s, write_date = %(now)s
+                          FROM extended_attendance_person_import s
+                         WHERE p.id = s.existing_id AND s.error IS NULL AND s.line BETWEEN %(first)s AND %(last)s
+                    """, chunk)
+                    chunk_updated = cr.rowcount
+                    cr.execute(f"""
+                        INSERT INTO {self._table} (
+                            person_id, person_type_id, {', '.join(IMPORT_WRITE_COLUMNS)},
+                            access_level, requires_approval, custom_field_values, active, is_checked_in,
+                            create_uid, create_date, write_uid, write_date
+                        )
+                        SELECT s.person_id, s.person_type_id, {', '.join(f's.{column}' for column in IMPORT_WRITE_COLUMNS)},
+                               coalesce(s.access_level, pt.default_access_level, 'basic'), pt.requires_approval,
+                               s.custom_fields, TRUE, FALSE, %(uid)s, %(now)s, %(uid)s, %(now)s
+                          FROM extended_attendance_person_import s
+                          JOIN person_type pt ON pt.id = s.person_type_id
+                         WHERE s.existing_id IS NULL AND s.error IS NULL AND s.line BETWEEN %(first)s AND %(last)s
+                      ORDER BY s.line
+                    """, chunk)
+                    chunk_created = cr.rowcount
+                updated += chunk_updated
+                created += chunk_created
+            except psycopg2.Error as e:
+                # Rows of a failed chunk are reported with the database error
+                cr.execute("""
+                    UPDATE extended_attendance_person_import SET error = %s
+                     WHERE error IS NULL AND line BETWEEN %s AND %s
+                """, [e.pgerror or str(e), chunk['first'], chunk['last']])
+
+        cr.execute("""
+            SELECT line, person_id, error FROM extended_attendance_person_import
+             WHERE error IS NOT NULL ORDER BY line
+        """)
+        errors += [{'line': line, 'person_id': person_id or False, 'error': error} for line, person_id, error in cr.fetchall()]
+        errors.sort(key=lambda error: error['line'])
+        cr.execute("DROP TABLE extended_attendance_person_import")
+
+        self.invalidate_model()
+        if updated:
+            # Updated persons may have changed type or end date
+            bump_version(cr, PERSON_ACCESS_VERSION, self.env.uid)
+        return {
+            'total': total,
+            'created': created,
+            'updated': updated,
+            'errors': errors,
+        }
@@ -0,0 +1,192 @@
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+from datetime import timedelta
+import pytz
+
+# System parameters controlling how long each resolution is kept (in days)
+RAW_DAYS_PARAM = 'extended_attendance.occupancy_raw_days'
+HOURLY_DAYS_PARAM = 'extended_attendance.occupancy_hourly_days'
+RETENTION_DAYS_PARAM = 'extended_attendance.occupancy_retention_days'
+DEFAULT_RAW_DAYS = 7
+DEFAULT_HOURLY_DAYS = 90
+DEFAULT_RETENTION_DAYS = 730
+
+SERIES_INTERVALS = ('hour', 'day', 'week', 'month')
+
+
+class AttendanceOccupancySample(models.Model):
+    _name = 'attendance.occupancy.sample'
+    _description = 'Location Occupancy Sample'
+    _order = 'sample_time desc, location_id'
+
+    location_id = fields.Many2one(
+        'attendance.location',
+        string='Location',
+        required=True,
+        readonly=True,
+        index=True,
+        ondelete='cascade'
+    )
+
+    sample_time = fields.Datetime(
+        string='Sample Time',
+        required=True,
+        readonly=True,
+        help='When the sample was taken, or the start of the hour/day it summarizes'
+    )
+
+    resolution = fields.Selection([
+        ('raw', 'Raw'),
+        ('hour', 'Hourly'),
+        ('day', 'Daily'),
+    ], string='Resolution', required=True, readonly=True, default='raw')
+
+    occupancy = fields.Float(
+        string='Occupancy',
+        readonly=True,
+        group_operator='avg',
+        help='People checked in, averaged over the summarized samples'
+    )
+
+    peak_occupancy = fields.Integer(
+        string='Peak Occupancy',
+        readonly=True,
+        group_operator='max'
+    )
+
+    capacity = fields.Integer(
+        string='Capacity',
+        readonly=True,
+        group_operator='max',
+        help='Capacity of the location when the sample was taken'
+    )
+
+    sample_count = fields.Integer(
+        string='Samples',
+        readonly=True,
+        help='Number of raw samples summarized by this row'
+    )
+
+    def init(self):
+        """Create the (location, time) index used by the series queries"""
+        tools.create_index(
+            self._cr, 'attendance_occupancy_sample_location_time_idx',
+            self._table, ['location_id', 'sample_time']
+        )
+
+    @api.model
+    def _cron_sample(self):
+        """Record the occupancy of every active location in one INSERT"""
+        self.env['extended.attendance.record'].flush_model(['location_id', 'check_out'])
+        self.env.cr.execute(f"""
+            INSERT INTO {self._table} (location_id, sample_time, resolution, occupancy, peak_occupancy,
+                                       capacity, sample_count, create_uid, create_date, write_uid, write_date)
+            SELECT l.id, %(now)s, 'raw', count(r.id), count(r.id),
+                   coalesce(l.capacity, 0), 1, %(uid)s, %(now)s, %(uid)s, %(now)s
+              FROM attendance_location l
+         LEFT JOIN extended_attendance_record r ON r.location_id = l.id AND r.check_out IS NULL
+             WHERE l.active
+          GROUP BY l.id
+        """, {'now': self.env.cr.now(), 'uid': self.env.uid})
+        return True
+
+    @api.model
+    def _downsample(self, source, target, before):
+        """Merge ``source`` rows older than ``before`` into one ``target`` row per bucket"""
+        params = {'source': source, 'target': target, 'before': before,
+                  'uid': self.env.uid, 'now': self.env.cr.now()}
+        self.env.cr.execute(f"""
+            INSERT INTO {self._table} (location_id, sample_time, resolution, occupancy, peak_occupancy,
+                                       capacity, sample_count, create_uid, create_date, write_uid, write_date)
+            SELECT location_id, date_trunc(%(target)s, sample_time), %(target)s,
+                   sum(occupancy * sample_count) / sum(sample_count), max(peak_occupancy),
+                   max(capacity), sum(sample_count), %(uid)s, %(now)s, %(uid)s, %(now)s
+              FROM {self._table}
+             WHERE resolution = %(source)s AND sample_time < %(before)s
+          GROUP BY location_id, date_trunc(%(target)s, sample_time)
+        """, params)
+        self.env.cr.execute(f"""
+            DELETE FROM {self._table} WHERE resolution = %(source)s AND sample_time < %(before)s
+        """, params)
+
+    @api.model
+    def _cron_compact(self):
+        """Downsample old raw samples to hourly and old hourly ones to daily rows,
+        then drop daily rows past the retention period (0 keeps them forever)"""
+        ICP = self.env['ir.config_parameter'].sudo()
+        raw_days = int(ICP.get_param(RAW_DAYS_PARAM, DEFAULT_RAW_DAYS))
+        hourly_days = int(ICP.get_param(HOURLY_DAYS_PARAM, DEFAULT_HOURLY_DAYS))
+        retention_days = int(ICP.get_param(RETENTION_DAYS_PARAM, DEFAULT_RETENTION_DAYS))
+
+        self.flush_model()
+        now = self.env.cr.now()
+        # Cut on bucket boundaries so each bucket is merged exactly once
+        raw_before = (now - timedelta(days=raw_days)).replace(minute=0, second=0, microsecond=0)
+        hourly_before = (now - timedelta(days=hourly_days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._downsample('raw', 'hour', raw_before)
+        self._downsample('hour', 'day', hourly_before)
+
+        if retention_days:
+            self.env.cr.execute(f"DELETE FROM {self._table} WHERE sample_time < %s",
+                                [now - timedelta(days=retention_days)])
+        self.invalidate_model()
+        return True
+
+    @api.model
+    def get_occupancy_series(self, date_from, date_to, location_code=None, interval='hour'):
+        """Return average and peak occupancy per location and interval.
+
+        Averages are weighted by ``sample_count``, the same way
+        ``_downsample`` merges rows, so an hourly or daily row counts for
+        every raw sample it summarizes. Each point also holds the
+        utilization, the peak as a percentage of the location capacity
+        (False when the capacity is not set). An unknown ``location_code``
+        returns no series.
+        """
+        if interval not in SERIES_INTERVALS:
+            raise UserError(_('Invalid occupancy interval: %s') % interval)
+
+        domain = [('sample_time', '>=', date_from), ('sample_time', '<=', date_to)]
+        if location_code:
+            location = self.env['attendance.location'].search([('code', '=', location_code)], limit=1)
+            if not location:
+                return []
+            domain.append(('location_id', 'child_of', location.id))
+
+        self.flush_model(['location_id', 'sample_time', 'occupancy', 'peak_occupancy', 'capacity', 'sample_count'])
+        query = self._where_calc(domain)
+        self._apply_ir_rules(query, 'read')
+        # Bucket in the user's timezone, like read_group does
+        tz = self.env.context.get('tz')
+        samples = query.select(*(
+            SQL.identifier(self._table, column)
+            for column in ('location_id', 'sample_time', 'occupancy', 'peak_occupancy', 'capacity', 'sample_count')
+        ))
+        self.env.cr.execute(SQL("""
+            SELECT s.location_id,
+                   date_trunc(%s, timezone(%s, timezone('UTC', s.sample_time))) AS bucket,
+                   sum(s.occupancy * s.sample_count) / nullif(sum(s.sample_count), 0),
+                   max(s.peak_occupancy),
+                   max(s.capacity)
+              FROM (%s) s
+          GROUP BY s.location_id, bucket
+          ORDER BY s.location_id, bucket
+        """, interval, tz if tz in pytz.all_timezones_set else 'UTC', samples))
+        rows = self.env.cr.fetchall()
+
+        series = {}
+        for location_id, bucket, occupancy, peak, capacity in rows:
+            points = series.setdefault(location_id, {'capacity': capacity, 'points': []})['points']
+            points.append({
+                'time': fields.Datetime.to_string(bucket),
+                'occupancy': round(occupancy or 0.0, 2),
+                'peak_occupancy': peak,
+                'utilization': round(peak * 100.0 / capacity, 1) if capacity else False,
+            })
+
+        locations = self.env['attendance.location'].browse(list(series)).sorted()
+        return [
+            dict(location_id=location.id, location_name=location.name, **series[location.id])
+            for location in locations
+        ]
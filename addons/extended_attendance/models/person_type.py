@@ -79,6 +79,13 @@ class PersonType(models.Model):
         string='Max Duration (Hours)',
         help='Maximum allowed duration for attendance (0 = no limit)'
     )
+
+    overtime_recompute_pending = fields.Boolean(
+        string='Overtime Recompute Pending',
+        readonly=True,
+        copy=False,
+        help='The max duration changed and existing attendance records are being re-flagged'
+    )
     
     # Custom fields configuration
     custom_field_ids = fields.One2many(
@@ -118,6 +125,15 @@ class PersonType(models.Model):
             if self.search_count([('name', '=', record.name), ('id', '!=', record.id)]) > 0:
                 raise ValidationError(_('Person type name must be unique. Name "%s" already exists.') % record.name)
 
+    def write(self, vals):
+        """Override write to re-flag overtime in the background when the limit changes"""
+        if 'max_duration_hours' in vals:
+            vals = dict(vals, overtime_recompute_pending=True)
+        res = super().write(vals)
+        if 'max_duration_hours' in vals:
+            self.env.ref('extended_attendance.ir_cron_overtime_recompute')._trigger()
+        return res
+
     def unlink(self):
         """Override unlink to prevent deletion of system types and types with persons"""
         for record in self:
@@ -237,7 +253,7 @@ class CustomField(models.Model):
     )
     
     person_type_id = fields.Many2one(
-        'extended.attendance.person.type',
+        'person.type',
         string='Person Type',
         required=True,
         ondelete='cascade'
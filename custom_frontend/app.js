@@ -140,9 +140,8 @@ async function clockIn() {
         await odooAPI.clockIn(parseInt(employeeId));
         showMessage('Successfully clocked in!', 'success');
         
-        // Refresh data
-        await loadAttendance();
-        await onEmployeeChange();
+        // Refresh data (issued together so the calls are batched)
+        await Promise.all([loadAttendance(), onEmployeeChange()]);
     } catch (error) {
         showMessage('Error clocking in: ' + error.message, 'error');
     }
@@ -161,9 +160,8 @@ async function clockOut() {
         await odooAPI.clockOut(parseInt(employeeId));
         showMessage('Successfully clocked out!', 'success');
         
-        // Refresh data
-        await loadAttendance();
-        await onEmployeeChange();
+        // Refresh data (issued together so the calls are batched)
+        await Promise.all([loadAttendance(), onEmployeeChange()]);
     } catch (error) {
         showMessage('Error clocking out: ' + error.message, 'error');
     }
@@ -334,9 +332,8 @@ async function init() {
 
     showMessage('Connected successfully!', 'success');
     
-    // Load initial data
-    await loadEmployees();
-    await loadAttendance();
+    // Load initial data (issued together so the calls are batched)
+    await Promise.all([loadEmployees(), loadAttendance()]);
 }
 
 // Start the application when page loads
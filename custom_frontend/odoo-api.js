@@ -12,6 +12,7 @@ class OdooAPI {
         };
         this.uid = null;
         this.isAuthenticated = false;
+        this.pendingCalls = [];
     }
 
     // Update configuration
@@ -63,42 +64,72 @@ class OdooAPI {
     }
 
     // Generic API call to Odoo
+    // Calls issued in the same tick are coalesced into a single batch request
     async call(model, method, args = [], kwargs = {}) {
         if (!this.isAuthenticated) {
             throw new Error('Not authenticated. Please authenticate first.');
         }
 
+        return new Promise((resolve, reject) => {
+            this.pendingCalls.push({ call: { model, method, args, kwargs }, resolve, reject });
+            if (this.pendingCalls.length === 1) {
+                queueMicrotask(() => this.flushCalls());
+            }
+        });
+    }
+
+    // Send all queued calls, using call_kw for a lone call and the batch endpoint otherwise
+    async flushCalls() {
+        const batch = this.pendingCalls;
+        this.pendingCalls = [];
+
         try {
-            const response = await fetch(`${this.config.url}/web/dataset/call_kw`, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    jsonrpc: '2.0',
-                    method: 'call',
-                    params: {
-                        model: model,
-                        method: method,
-                        args: args,
-                        kwargs: kwargs
+            if (batch.length === 1) {
+                batch[0].resolve(await this.rpc('/web/dataset/call_kw', batch[0].call));
+            } else {
+                // Each call gets its own result, so one failing call doesn't reject the others
+                const results = await this.rpc('/api/attendance/batch', {
+                    calls: batch.map(entry => entry.call)
+                });
+                batch.forEach((entry, index) => {
+                    const { result, error } = results[index];
+                    if (error) {
+                        console.error('API call error:', error);
+                        entry.reject(new Error(error));
+                    } else {
+                        entry.resolve(result);
                     }
-                })
-            });
-
-            const data = await response.json();
-            
-            if (data.error) {
-                throw new Error(data.error.message || 'API call failed');
+                });
             }
-            
-            return data.result;
         } catch (error) {
             console.error('API call error:', error);
-            throw error;
+            batch.forEach(entry => entry.reject(error));
         }
     }
 
+    // Send a JSON-RPC request to Odoo
+    async rpc(route, params) {
+        const response = await fetch(`${this.config.url}${route}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                jsonrpc: '2.0',
+                method: 'call',
+                params: params
+            })
+        });
+
+        const data = await response.json();
+        
+        if (data.error) {
+            throw new Error(data.error.message || 'API call failed');
+        }
+        
+        return data.result;
+    }
+
     // Employee methods
     async getEmployees() {
         return await this.call('hr.employee', 'search_read', [], {
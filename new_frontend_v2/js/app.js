@@ -197,6 +197,11 @@ class ExtendedAttendanceApp {
             console.log('Loading initial data...');
             await appState.loadData();
             console.log('Initial data loaded successfully');
+
+            // Receive check-in/check-out diffs instead of polling
+            if (!this.api.useMockData) {
+                liveUpdates.start({ url: this.api.websocketUrl, lastId: this.api.presenceLastId });
+            }
         } catch (error) {
             console.error('Failed to load initial data:', error);
             Utils.showToast('Failed to load data', 'error');
@@ -214,6 +219,7 @@ class ExtendedAttendanceApp {
             message: 'Are you sure you want to logout?',
             confirmText: 'Logout',
             onConfirm: () => {
+                liveUpdates.stop();
                 appState.logout();
                 this.api = new ExtendedOdooAPI();
                 Utils.showToast('Logged out successfully', 'info');
@@ -407,6 +407,17 @@ class DashboardComponent {
         }
     }
 
+    /**
+     * Refresh the server-side dashboard aggregates
+     */
+    async refreshDashboard() {
+        try {
+            await appState.loadDashboard();
+        } catch (error) {
+            console.error('Failed to refresh dashboard statistics:', error);
+        }
+    }
+
     /**
      * Start auto-refresh
      */
@@ -419,7 +430,10 @@ class DashboardComponent {
         // Set up new interval (every 30 seconds)
         this.refreshInterval = setInterval(async () => {
             if (appState.getState().ui.currentView === 'dashboard') {
-                await this.refreshCurrentAttendance();
+                await Promise.all([
+                    this.refreshCurrentAttendance(),
+                    this.refreshDashboard()
+                ]);
             }
         }, Constants.DEFAULTS.REFRESH_INTERVAL);
     }
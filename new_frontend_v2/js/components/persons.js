@@ -120,12 +120,16 @@ class PersonsComponent {
         const statusClass = person.is_checked_in ? 'online' : '';
         const statusText = person.is_checked_in ? 'Checked In' : 'Not Checked In';
         const locationText = person.current_location ? ` at ${person.current_location.name}` : '';
+        const thumbnailUrl = window.app.api.getThumbnailUrl(person.thumbnail_url);
+        const avatar = thumbnailUrl
+            ? `<img src="${thumbnailUrl}" alt="" loading="lazy" width="60" height="60">`
+            : initials;
         
         return `
             <div class="person-card" data-person-id="${person.id}">
                 <div class="person-card-header">
                     <div class="person-avatar">
-                        ${initials}
+                        ${avatar}
                     </div>
                     <h5 class="person-name">${Utils.sanitizeHtml(person.name)}</h5>
                     <div class="person-type">${Utils.sanitizeHtml(person.person_type.name)}</div>
@@ -238,6 +238,14 @@ class ReportsComponent {
                         <strong>Average Hours:</strong>
                         <span>${Utils.formatDuration(statistics.average_hours)}</span>
                     </div>
+                    <div class="stat-item">
+                        <strong>Median / 90th Percentile:</strong>
+                        <span>${Utils.formatDuration(statistics.median_hours || 0)} / ${Utils.formatDuration(statistics.p90_hours || 0)}</span>
+                    </div>
+                    <div class="stat-item">
+                        <strong>Unique Persons:</strong>
+                        <span>${statistics.unique_persons || 0}</span>
+                    </div>
                     <div class="stat-item">
                         <strong>Date Range:</strong>
                         <span>${Utils.formatDate(statistics.date_from)} - ${Utils.formatDate(statistics.date_to)}</span>
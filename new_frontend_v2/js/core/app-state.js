@@ -30,6 +30,9 @@ class AppState {
             currentAttendance: [],
             attendanceRecords: [],
 
+            // Server-side dashboard aggregates (totals, occupancy, daily counts)
+            dashboard: null,
+
             // UI state
             ui: {
                 currentView: 'dashboard',
@@ -170,11 +173,12 @@ class AppState {
             console.log('Loading data from API...');
             
             // Load all core data in parallel
-            const [personTypes, locations, persons, currentAttendance] = await Promise.all([
+            const [personTypes, locations, persons, currentAttendance, dashboard] = await Promise.all([
                 this.api.getPersonTypes(),
                 this.api.getLocations(),
                 this.api.getPersons(),
-                this.api.getCurrentAttendance()
+                this.api.getCurrentAttendance(),
+                this.api.getDashboard()
             ]);
 
             // Update state with loaded data
@@ -182,7 +186,8 @@ class AppState {
                 personTypes: personTypes.data || [],
                 locations: locations.data || [],
                 persons: persons.data || [],
-                currentAttendance: currentAttendance.data || []
+                currentAttendance: currentAttendance.data || [],
+                dashboard: dashboard.data || null
             });
 
             // Calculate statistics
@@ -200,7 +205,7 @@ class AppState {
      * Update statistics based on current data
      */
     updateStatistics() {
-        const { personTypes, locations, persons, currentAttendance } = this.state;
+        const { personTypes, locations, persons, currentAttendance, dashboard } = this.state;
         
         const locationOccupancy = {};
         locations.forEach(location => {
@@ -211,17 +216,29 @@ class AppState {
             };
         });
 
+        // Prefer the server-side aggregates, counting the lists only without them
+        const totals = dashboard && dashboard.totals;
+
         this.setState({
             stats: {
-                totalPersons: persons.length,
-                totalLocations: locations.length,
+                totalPersons: totals ? totals.persons : persons.length,
+                totalLocations: totals ? totals.locations : locations.length,
                 currentlyCheckedIn: currentAttendance.length,
-                todayAttendance: currentAttendance.length, // Simplified for now
+                todayAttendance: totals ? totals.today_check_ins : currentAttendance.length,
                 locationOccupancy
             }
         });
     }
 
+    /**
+     * Reload the dashboard aggregates without fetching the full lists
+     */
+    async loadDashboard() {
+        const dashboard = await this.api.getDashboard();
+        this.setState({ dashboard: dashboard.data || null });
+        this.updateStatistics();
+    }
+
     /**
      * Authentication methods
      */
@@ -12,13 +12,25 @@ const Constants = {
     API_ENDPOINTS: {
         PERSON_TYPES: '/api/attendance/person-types',
         LOCATIONS: '/api/attendance/locations',
+        LOCATION_TREE: '/api/attendance/locations/tree',
         PERSONS: '/api/attendance/persons',
         ATTENDANCE: '/api/attendance',
         CHECK_IN: '/api/attendance/check-in',
         CHECK_OUT: '/api/attendance/check-out',
         CURRENT: '/api/attendance/current',
         RECORDS: '/api/attendance/records',
-        REPORT: '/api/attendance/report'
+        REPORT: '/api/attendance/report',
+        DASHBOARD: '/api/attendance/dashboard',
+        DAILY: '/api/attendance/daily',
+        OCCUPANCY: '/api/attendance/occupancy'
+    },
+
+    // Live updates pushed over the Odoo bus websocket
+    LIVE_UPDATES: {
+        CHANNEL: 'extended_attendance.presence',
+        NOTIFICATION_TYPE: 'extended_attendance/presence',
+        RECONNECT_DELAY: 5000,
+        MAX_RECONNECT_DELAY: 60000
     },
 
     // User roles and permissions
@@ -12,6 +12,8 @@ class ExtendedOdooAPI {
         this.uid = null;
         this.isConnected = false;
         this.sessionId = null;
+        this.websocketUrl = null;
+        this.presenceLastId = 0;
         this.useMockData = false;
     }
 
@@ -40,6 +42,8 @@ class ExtendedOdooAPI {
                     if (result.success) {
                         this.uid = result.uid;
                         this.sessionId = result.session_id;
+                        this.websocketUrl = result.websocket_url;
+                        this.presenceLastId = result.presence_last_id;
                         this.isConnected = true;
                         this.useMockData = false;
                         this.url = null; // Use relative paths for proxy server
@@ -159,6 +163,11 @@ class ExtendedOdooAPI {
         return result;
     }
 
+    async getLocationTree() {
+        // Nested tree prebuilt by the server: [{ ...location, children: [...] }]
+        return await this.apiCall('/api/attendance/locations/tree');
+    }
+
     async createLocation(data) {
         return await this.apiCall('/api/attendance/locations', 'POST', data);
     }
@@ -189,6 +198,14 @@ class ExtendedOdooAPI {
         return await this.apiCall(`/api/attendance/persons/${id}`, 'DELETE');
     }
 
+    /**
+     * Absolute URL of a person's thumbnail, from the directory's thumbnail_url
+     */
+    getThumbnailUrl(thumbnailUrl) {
+        if (!thumbnailUrl || this.useMockData) return null;
+        return this.url ? `${this.url}${thumbnailUrl}` : thumbnailUrl;
+    }
+
     async searchPerson(identifier) {
         return await this.apiCall('/api/attendance/persons/search', 'POST', { identifier });
     }
@@ -221,16 +238,40 @@ class ExtendedOdooAPI {
         return result;
     }
 
+    async getDashboard() {
+        // Totals, occupancy and daily counts aggregated server-side
+        return await this.apiCall(Constants.API_ENDPOINTS.DASHBOARD);
+    }
+
     async getAttendanceRecords(filters = {}) {
         return await this.apiCall('/api/attendance/records', 'GET', filters);
     }
 
-    async generateReport(dateFrom, dateTo, locationCode = null, personTypeCode = null) {
+    async getDailyTrend(dateFrom, dateTo, locationCode = null, personTypeCode = null) {
+        // Per-day totals read from the pre-aggregated daily summaries
+        const params = { date_from: dateFrom, date_to: dateTo };
+        if (locationCode) params.location_code = locationCode;
+        if (personTypeCode) params.person_type_code = personTypeCode;
+        return await this.apiCall(`${Constants.API_ENDPOINTS.DAILY}?${new URLSearchParams(params)}`);
+    }
+
+    async getOccupancyHistory(dateFrom, dateTo, locationCode = null, interval = 'hour') {
+        // Average/peak occupancy per location from the sampled time series
+        const params = { date_from: dateFrom, date_to: dateTo, interval };
+        if (locationCode) params.location_code = locationCode;
+        return await this.apiCall(`${Constants.API_ENDPOINTS.OCCUPANCY}?${new URLSearchParams(params)}`);
+    }
+
+    async generateReport(dateFrom, dateTo, locationCode = null, personTypeCode = null, options = {}) {
+        // options: groupBy (day, week, month, location, person_type, person), limit, offset
         return await this.apiCall('/api/attendance/report', 'POST', {
             date_from: dateFrom,
             date_to: dateTo,
             location_code: locationCode,
-            person_type_code: personTypeCode
+            person_type_code: personTypeCode,
+            group_by: options.groupBy || null,
+            limit: options.limit || null,
+            offset: options.offset || 0
         });
     }
 
@@ -278,6 +319,15 @@ class ExtendedOdooAPI {
                     { id: 5, name: 'Diana Prince', person_id: 'STU002', person_type: { name: 'Student', code: 'STU' }, is_checked_in: true, current_location: { name: 'Science Lab', code: 'SCI_LAB' } }
                 ]
             },
+            '/api/attendance/dashboard': {
+                success: true,
+                data: {
+                    totals: { persons: 172, locations: 5, checked_in: 4, today_check_ins: 12, today_worked_hours: 18.5 },
+                    locations: [],
+                    person_types: [],
+                    daily: []
+                }
+            },
             '/api/attendance/current': {
                 success: true,
                 data: [
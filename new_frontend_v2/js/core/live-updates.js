@@ -0,0 +1,150 @@
+/**
+ * Live Updates
+ * Subscribes to the Odoo bus presence channel and patches application state
+ * with check-in/check-out diffs instead of reloading the attendance list
+ */
+
+class LiveUpdates {
+    constructor() {
+        this.socket = null;
+        this.url = null;
+        this.lastId = 0;
+        this.reconnectDelay = Constants.LIVE_UPDATES.RECONNECT_DELAY;
+        this.reconnectTimer = null;
+        this.stopped = true;
+    }
+
+    /**
+     * Open the websocket and subscribe to the presence channel.
+     * `url` is the Odoo websocket configured on the proxy and `lastId` the
+     * latest notification already reflected in the loaded data, so older
+     * notifications are not replayed on top of it.
+     */
+    start({ url, lastId }) {
+        if (!this.stopped || !url || !('WebSocket' in window)) return;
+        this.url = url;
+        this.lastId = lastId || 0;
+        this.stopped = false;
+        this.connect();
+    }
+
+    /**
+     * Close the websocket and stop reconnecting
+     */
+    stop() {
+        this.stopped = true;
+        clearTimeout(this.reconnectTimer);
+        if (this.socket) {
+            this.socket.close();
+            this.socket = null;
+        }
+    }
+
+    connect() {
+        try {
+            this.socket = new WebSocket(this.url);
+        } catch (error) {
+            console.log('Live updates unavailable:', error);
+            this.scheduleReconnect();
+            return;
+        }
+
+        this.socket.addEventListener('open', () => {
+            this.reconnectDelay = Constants.LIVE_UPDATES.RECONNECT_DELAY;
+            this.socket.send(JSON.stringify({
+                event_name: 'subscribe',
+                data: { channels: [Constants.LIVE_UPDATES.CHANNEL], last: this.lastId }
+            }));
+        });
+
+        this.socket.addEventListener('message', (event) => {
+            this.handleNotifications(JSON.parse(event.data));
+        });
+
+        this.socket.addEventListener('close', () => {
+            this.socket = null;
+            this.scheduleReconnect();
+        });
+    }
+
+    scheduleReconnect() {
+        if (this.stopped) return;
+        this.reconnectTimer = setTimeout(() => this.connect(), this.reconnectDelay);
+        this.reconnectDelay = Math.min(this.reconnectDelay * 2, Constants.LIVE_UPDATES.MAX_RECONNECT_DELAY);
+    }
+
+    /**
+     * Apply presence notifications to the application state
+     */
+    handleNotifications(notifications) {
+        notifications.forEach(notification => {
+            this.lastId = Math.max(this.lastId, notification.id);
+            const { type, payload } = notification.message;
+            if (type === Constants.LIVE_UPDATES.NOTIFICATION_TYPE) {
+                this.applyPresence(payload);
+            }
+        });
+    }
+
+    applyPresence(payload) {
+        const state = appState.getState();
+        const current = new Map(state.currentAttendance.map(record => [record.id, record]));
+        const occupancy = {};
+        let newCheckIns = 0;
+
+        const addOccupancy = (locationId, delta) => {
+            occupancy[locationId] = (occupancy[locationId] || 0) + delta;
+        };
+
+        // Events already reflected in the current attendance are skipped,
+        // so the occupancy and the check-in count are never applied twice
+        payload.events.forEach(event => {
+            const known = current.get(event.id);
+            if (event.type === 'check_in') {
+                if (known && known.location_id === event.location_id) return;
+                if (known) addOccupancy(known.location_id, -1);
+                current.set(event.id, {
+                    id: event.id,
+                    person_id: event.person_id,
+                    person_name: event.person_name,
+                    location_id: event.location_id,
+                    location_name: event.location_name,
+                    check_in: event.check_in,
+                    state: Constants.ATTENDANCE_STATES.CHECKED_IN,
+                    auto_action: event.auto_action,
+                    is_auto: event.auto_action !== 'manual'
+                });
+                addOccupancy(event.location_id, 1);
+                // Moves and reopenings are not new check-ins
+                if (!event.reason) newCheckIns += 1;
+            } else {
+                if (!known || known.location_id !== event.location_id) return;
+                current.delete(event.id);
+                addOccupancy(event.location_id, -1);
+            }
+        });
+
+        // Keep today's check-in count current between dashboard reloads
+        const dashboard = state.dashboard && newCheckIns ? {
+            ...state.dashboard,
+            totals: { ...state.dashboard.totals, today_check_ins: state.dashboard.totals.today_check_ins + newCheckIns }
+        } : state.dashboard;
+
+        appState.setState({
+            dashboard,
+            currentAttendance: Array.from(current.values()),
+            locations: state.locations.map(location => {
+                const delta = occupancy[location.id];
+                return delta ? { ...location, current_occupancy: Math.max((location.current_occupancy || 0) + delta, 0) } : location;
+            })
+        });
+
+        appState.updateStatistics();
+    }
+}
+
+// Create global instance
+window.liveUpdates = new LiveUpdates();
+
+// Export for use in other modules
+window.LiveUpdates = LiveUpdates;
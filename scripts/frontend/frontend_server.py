@@ -4,27 +4,61 @@ Simple HTTP server to serve the new_frontend_v2 and provide API proxy to Odoo
 """
 
 import http.server
-import socketserver
+import base64
 import json
+import re
 import urllib.parse
-import xmlrpc.client
-import os
-import sys
 from pathlib import Path
 
+from odoo_client import OdooClient
+from response_cache import ResponseCache
+
 # Configuration
 PORT = 8080
 ODOO_URL = "http://localhost:10017"
+# Odoo websocket for live updates: the gevent port 8072, published as 20017 by docker-compose
+ODOO_WEBSOCKET_URL = "ws://localhost:20017/websocket"
 ODOO_DB = "extended_attendance"
 ODOO_USERNAME = "admin@demo.com"
 ODOO_PASSWORD = "admin"
+FRONTEND_DIR = Path(__file__).parent.parent.parent / "new_frontend_v2"
+
+# Shared by all request threads: one login, keep-alive connections per thread
+odoo = OdooClient(ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
+
+# Seconds each GET endpoint may be served from the response cache
+CACHE_TTLS = {
+    '/api/attendance/person-types': 300,
+    '/api/attendance/locations': 300,
+    '/api/attendance/locations/tree': 300,
+    '/api/attendance/persons': 30,
+    '/api/attendance/current': 5,
+    '/api/attendance/dashboard': 10,
+}
+
+# Cached endpoints made stale by a successful POST
+CACHE_INVALIDATIONS = {
+    '/api/attendance/check-in': ['/api/attendance/persons', '/api/attendance/current',
+                                 '/api/attendance/locations', '/api/attendance/locations/tree',
+                                 '/api/attendance/dashboard'],
+    '/api/attendance/check-out': ['/api/attendance/persons', '/api/attendance/current',
+                                 '/api/attendance/locations', '/api/attendance/locations/tree',
+                                 '/api/attendance/dashboard'],
+    '/api/attendance/persons': ['/api/attendance/persons', '/api/attendance/person-types',
+                                '/api/attendance/dashboard'],
+}
+
+# Versioned photo thumbnail URLs, as returned in the persons directory
+THUMBNAIL_PATH = re.compile(r'^/api/attendance/persons/(\d+)/thumbnail/(\d+)$')
+
+response_cache = ResponseCache()
 
 class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
+    served_from_cache = False
+
     def __init__(self, *args, **kwargs):
         # Set the directory to serve files from
-        frontend_dir = Path(__file__).parent.parent.parent / "new_frontend_v2"
-        os.chdir(frontend_dir)
-        super().__init__(*args, **kwargs)
+        super().__init__(*args, directory=str(FRONTEND_DIR), **kwargs)
     
     def do_POST(self):
         if self.path.startswith('/api/'):
@@ -39,39 +73,56 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             super().do_GET()
     
     def handle_api_request(self):
+        # Serve reference data from memory between changes
+        if self.command == 'GET' and self.path in CACHE_TTLS:
+            cached = response_cache.get(self.path)
+            if cached is not None:
+                self.served_from_cache = True
+                self.send_json_response(cached)
+                return
+
         try:
-            # Connect to Odoo
-            common = xmlrpc.client.ServerProxy(f'{ODOO_URL}/xmlrpc/2/common')
-            models = xmlrpc.client.ServerProxy(f'{ODOO_URL}/xmlrpc/2/object')
-            uid = common.authenticate(ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD, {})
+            # Cached login and a pooled keep-alive connection to Odoo
+            uid = odoo.uid
 
             if not uid:
                 self.send_error_response("Authentication failed")
                 return
 
-            # Handle different API endpoints
-            if self.path == '/api/connect':
-                self.handle_connect(models, uid)
-            elif self.path == '/api/attendance/person-types':
-                self.handle_person_types(models, uid)
-            elif self.path == '/api/attendance/locations':
-                self.handle_locations(models, uid)
-            elif self.path == '/api/attendance/persons':
-                self.handle_persons(models, uid)
-            elif self.path == '/api/attendance/check-in':
-                self.handle_check_in(models, uid)
-            elif self.path == '/api/attendance/persons' and self.command == 'POST':
-                self.handle_create_person(models, uid)
-            elif self.path == '/api/attendance/current':
-                self.handle_current_attendance(models, uid)
-            elif self.path == '/api/attendance/check-out':
-                self.handle_check_out(models, uid)
-            else:
-                self.send_error_response("Endpoint not found")
+            with odoo.connection() as models:
+                self.dispatch_api_request(models, uid)
 
         except Exception as e:
             self.send_error_response(str(e))
 
+    def dispatch_api_request(self, models, uid):
+        """Route an API request to its handler"""
+        # Handle different API endpoints
+        if self.path == '/api/connect':
+            self.handle_connect(models, uid)
+        elif self.path == '/api/attendance/person-types':
+            self.handle_person_types(models, uid)
+        elif self.path == '/api/attendance/locations':
+            self.handle_locations(models, uid)
+        elif self.path == '/api/attendance/locations/tree':
+            self.handle_location_tree(models, uid)
+        elif self.path == '/api/attendance/persons' and self.command == 'POST':
+            self.handle_create_person(models, uid)
+        elif self.path == '/api/attendance/persons':
+            self.handle_persons(models, uid)
+        elif THUMBNAIL_PATH.match(urllib.parse.urlsplit(self.path).path):
+            self.handle_person_thumbnail(models, uid)
+        elif self.path == '/api/attendance/check-in':
+            self.handle_check_in(models, uid)
+        elif self.path == '/api/attendance/dashboard':
+            self.handle_dashboard(models, uid)
+        elif self.path == '/api/attendance/current':
+            self.handle_current_attendance(models, uid)
+        elif self.path == '/api/attendance/check-out':
+            self.handle_check_out(models, uid)
+        else:
+            self.send_error_response("Endpoint not found")
+
     def handle_connect(self, models, uid):
         """Handle connection request from frontend"""
         try:
@@ -79,6 +130,13 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             post_data = self.rfile.read(content_length)
             data = json.loads(post_data.decode('utf-8'))
 
+            # Live updates resume after the latest notification, as the data
+            # loaded next already reflects the earlier ones
+            presence_last_id = models.execute_kw(
+                ODOO_DB, uid, ODOO_PASSWORD,
+                'extended.attendance.record', 'get_presence_last_id', []
+            )
+
             # Since we already authenticated to get here, just return success
             # Return empty string for URL so frontend uses relative paths
             self.send_json_response({
@@ -86,6 +144,8 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
                 'uid': uid,
                 'session_id': 'proxy_session',
                 'url': '',  # Use relative paths
+                'websocket_url': ODOO_WEBSOCKET_URL,
+                'presence_last_id': presence_last_id,
                 'message': 'Connected via proxy server'
             })
 
@@ -128,49 +188,17 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
     
     def handle_locations(self, models, uid):
         try:
+            # level and location_path are stored on the server, so no ancestry walks here
             locations = models.execute_kw(
                 ODOO_DB, uid, ODOO_PASSWORD,
                 'attendance.location', 'search_read',
                 [[('active', '=', True)]],
                 {'fields': ['name', 'code', 'capacity', 'current_occupancy', 'building', 'floor', 'active',
-                           'parent_location_id'], 'order': 'sequence, name'}
+                           'parent_location_id', 'level', 'location_path'], 'order': 'level, name'}
             )
-            
-            # Build hierarchy information manually
-            location_map = {loc['id']: loc for loc in locations}
-
-            def calculate_level(loc_id, visited=None):
-                if visited is None:
-                    visited = set()
-                if loc_id in visited:
-                    return 0  # Prevent infinite recursion
-                visited.add(loc_id)
-
-                loc = location_map.get(loc_id)
-                if not loc or not loc['parent_location_id']:
-                    return 0
-                return 1 + calculate_level(loc['parent_location_id'][0], visited)
-
-            def build_path(loc_id, visited=None):
-                if visited is None:
-                    visited = set()
-                if loc_id in visited:
-                    return ""
-                visited.add(loc_id)
-
-                loc = location_map.get(loc_id)
-                if not loc:
-                    return ""
-                if not loc['parent_location_id']:
-                    return loc['name']
-                parent_path = build_path(loc['parent_location_id'][0], visited)
-                return f"{parent_path} / {loc['name']}" if parent_path else loc['name']
 
             data = []
             for loc in locations:
-                level = calculate_level(loc['id'])
-                path = build_path(loc['id'])
-
                 data.append({
                     'id': loc['id'],
                     'name': loc['name'],
@@ -182,12 +210,22 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
                     'active': loc['active'],
                     'parent_location_id': loc['parent_location_id'][0] if loc['parent_location_id'] else None,
                     'parent_location_name': loc['parent_location_id'][1] if loc['parent_location_id'] else None,
-                    'level': level,
-                    'location_path': path
+                    'level': loc['level'],
+                    'location_path': loc['location_path']
                 })
-
-            # Sort by level and name for hierarchical display
-            data.sort(key=lambda x: (x['level'], x['name']))
+            
+            self.send_json_response({'success': True, 'data': data})
+            
+        except Exception as e:
+            self.send_error_response(str(e))
+    
+    def handle_location_tree(self, models, uid):
+        """Handle getting locations as a prebuilt nested tree"""
+        try:
+            data = models.execute_kw(
+                ODOO_DB, uid, ODOO_PASSWORD,
+                'attendance.location', 'get_location_tree', []
+            )
             
             self.send_json_response({'success': True, 'data': data})
             
@@ -196,56 +234,49 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
     
     def handle_persons(self, models, uid):
         try:
-            persons = models.execute_kw(
+            # One server-side call joins types, open records and locations
+            data = models.execute_kw(
                 ODOO_DB, uid, ODOO_PASSWORD,
-                'extended.attendance.person', 'search_read',
-                [[]], 
-                {'fields': ['name', 'person_id', 'person_type_id', 'email', 'phone', 'active']}
+                'extended.attendance.person', 'get_directory', []
             )
             
-            data = []
-            for person in persons:
-                # Get person type info
-                person_type = {'name': '', 'code': ''}
-                if person['person_type_id']:
-                    pt_info = models.execute_kw(
-                        ODOO_DB, uid, ODOO_PASSWORD,
-                        'person.type', 'read',
-                        [person['person_type_id'][0]], {'fields': ['name', 'code']}
-                    )
-                    if pt_info:
-                        person_type = {'name': pt_info[0]['name'], 'code': pt_info[0]['code']}
-                
-                # Check current attendance status
-                current_attendance = models.execute_kw(
-                    ODOO_DB, uid, ODOO_PASSWORD,
-                    'extended.attendance.record', 'search_read',
-                    [[('person_id', '=', person['id']), ('state', '=', 'checked_in')]],
-                    {'fields': ['location_id'], 'limit': 1}
-                )
-                
-                is_checked_in = bool(current_attendance)
-                current_location = None
-                if current_attendance and current_attendance[0]['location_id']:
-                    loc_info = models.execute_kw(
-                        ODOO_DB, uid, ODOO_PASSWORD,
-                        'attendance.location', 'read',
-                        [current_attendance[0]['location_id'][0]], {'fields': ['name', 'code']}
-                    )
-                    if loc_info:
-                        current_location = {'name': loc_info[0]['name'], 'code': loc_info[0]['code']}
-                
-                data.append({
-                    'id': person['id'],
-                    'name': person['name'],
-                    'person_id': person['person_id'],
-                    'person_type': person_type,
-                    'is_checked_in': is_checked_in,
-                    'current_location': current_location,
-                    'email': person['email'] or '',
-                    'phone': person['phone'] or '',
-                    'active': person['active']
-                })
+            self.send_json_response({'success': True, 'data': data})
+            
+        except Exception as e:
+            self.send_error_response(str(e))
+    
+    def handle_person_thumbnail(self, models, uid):
+        """Handle getting a person's photo thumbnail, generated and cached by Odoo"""
+        try:
+            person_id, size = THUMBNAIL_PATH.match(urllib.parse.urlsplit(self.path).path).groups()
+            thumbnail = models.execute_kw(
+                ODOO_DB, uid, ODOO_PASSWORD,
+                'extended.attendance.person', 'get_thumbnail', [[int(person_id)], int(size)]
+            )
+            if not thumbnail:
+                self.send_error(404, "No photo")
+                return
+
+            # Versioned URLs carry the photo checksum, so browsers never need to revalidate them
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+            self.send_response(200)
+            self.send_header('Content-type', thumbnail['mimetype'])
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable' if query.get('v') else 'no-cache')
+            self.send_header('ETag', f'"{thumbnail["checksum"]}-{size}"')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(base64.b64decode(thumbnail['datas']))
+            
+        except Exception as e:
+            self.send_error_response(str(e))
+    
+    def handle_dashboard(self, models, uid):
+        """Handle getting the dashboard KPIs, aggregated by Odoo"""
+        try:
+            data = models.execute_kw(
+                ODOO_DB, uid, ODOO_PASSWORD,
+                'extended.attendance.record', 'get_dashboard_data', []
+            )
             
             self.send_json_response({'success': True, 'data': data})
             
@@ -448,7 +479,7 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
                 'extended.attendance.record', 'search_read',
                 [[('state', '=', 'checked_in')]],
                 {'fields': ['person_id', 'location_id', 'check_in', 'person_name', 'location_name',
-                           'auto_action', 'notes'], 'order': 'person_name, check_in'}
+                           'auto_action', 'notes'], 'order': 'person_id, check_in'}
             )
 
             data = []
@@ -476,6 +507,11 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             self.send_error_response(str(e))
 
     def send_json_response(self, data):
+        if self.command == 'GET' and self.path in CACHE_TTLS and not self.served_from_cache:
+            response_cache.set(self.path, data, CACHE_TTLS[self.path])
+        elif self.command == 'POST' and self.path in CACHE_INVALIDATIONS:
+            response_cache.invalidate(*CACHE_INVALIDATIONS[self.path])
+
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
@@ -504,7 +540,8 @@ if __name__ == "__main__":
     print(f"🔗 Proxying API calls to: {ODOO_URL}")
     print(f"🌐 Access the frontend at: http://localhost:{PORT}")
     
-    with socketserver.TCPServer(("", PORT), OdooAPIHandler) as httpd:
+    # One thread per connection, so a slow Odoo call doesn't block other kiosks
+    with http.server.ThreadingHTTPServer(("", PORT), OdooAPIHandler) as httpd:
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Shared Odoo XML-RPC client for the frontend proxy servers
+Pools keep-alive connections across request threads and logs in only once
+"""
+
+import queue
+import threading
+import xmlrpc.client
+from contextlib import contextmanager
+
+# Idle connections kept open to Odoo
+POOL_SIZE = 16
+
+
+class OdooClient:
+    """Thread-safe XML-RPC client with a cached login and pooled connections"""
+
+    def __init__(self, url, db, username, password, pool_size=POOL_SIZE):
+        self.url = url
+        self.db = db
+        self.username = username
+        self.password = password
+        self._uid = None
+        self._lock = threading.Lock()
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def _new_proxy(self, service='object'):
+        return xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/{service}', allow_none=True)
+
+    @contextmanager
+    def connection(self):
+        """Borrow an object-service proxy from the pool for one request.
+
+        Each ServerProxy keeps its HTTP/1.1 connection to Odoo open between
+        calls, but is not thread-safe, so it is used by one thread at a time
+        and returned to the pool afterwards.
+        """
+        try:
+            proxy = self._pool.get_nowait()
+        except queue.Empty:
+            proxy = self._new_proxy()
+        try:
+            yield proxy
+        finally:
+            try:
+                self._pool.put_nowait(proxy)
+            except queue.Full:
+                proxy('close')()
+
+    @property
+    def uid(self):
+        """Authenticated user id, logging in on first use only"""
+        if self._uid is None:
+            with self._lock:
+                if self._uid is None:
+                    uid = self._new_proxy('common').authenticate(self.db, self.username, self.password, {})
+                    # Don't cache failed logins, so the next request tries again
+                    if not uid:
+                        return uid
+                    self._uid = uid
+        return self._uid
+
+    def execute_kw(self, model, method, args, kwargs=None):
+        """Call a model method as the configured user"""
+        with self.connection() as models:
+            return models.execute_kw(self.db, self.uid, self.password, model, method, args, kwargs or {})
@@ -5,13 +5,14 @@ Connects to actual Odoo backend with extended attendance features
 """
 
 import http.server
-import socketserver
 import json
 import xmlrpc.client
 import urllib.parse
 from datetime import datetime
 import os
 
+from odoo_client import OdooClient
+
 # Configuration
 FRONTEND_PORT = 8081
 ODOO_URL = 'http://localhost:10017'
@@ -19,6 +20,9 @@ ODOO_DB = 'extended_attendance'
 ODOO_USERNAME = 'admin@demo.com'
 ODOO_PASSWORD = 'admin'
 
+# Shared by all request threads: one login, pooled keep-alive connections
+odoo = OdooClient(ODOO_URL, ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD)
+
 class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP handler that serves frontend files and proxies API calls to Odoo"""
     
@@ -92,14 +96,8 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             
             print(f"API Call: {model}.{method}({args}, {kwargs})")
             
-            # Connect to Odoo
-            models = xmlrpc.client.ServerProxy(f'{ODOO_URL}/xmlrpc/2/object')
-            
-            # Execute the call
-            result = models.execute_kw(
-                ODOO_DB, 2, ODOO_PASSWORD,  # Using UID 2 from setup
-                model, method, args, kwargs
-            )
+            # Execute the call over a pooled connection
+            result = odoo.execute_kw(model, method, args, kwargs)
             
             response = {
                 'success': True,
@@ -123,14 +121,10 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             
             print(f"Extended API call: {endpoint}")
             
-            # Connect to Odoo
-            models = xmlrpc.client.ServerProxy(f'{ODOO_URL}/xmlrpc/2/object')
-            
             if endpoint == 'person-types':
                 # Get person types (or create mock if model doesn't exist)
                 try:
-                    person_types = models.execute_kw(
-                        ODOO_DB, 2, ODOO_PASSWORD,
+                    person_types = odoo.execute_kw(
                         'person.type', 'search_read', [],
                         {'fields': ['name', 'code', 'default_access_level', 'is_system']}
                     )
@@ -154,8 +148,7 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             elif endpoint == 'locations':
                 # Get attendance locations
                 try:
-                    locations = models.execute_kw(
-                        ODOO_DB, 2, ODOO_PASSWORD,
+                    locations = odoo.execute_kw(
                         'attendance.location', 'search_read', [],
                         {'fields': ['name', 'code', 'building', 'floor', 'capacity', 'current_occupancy']}
                     )
@@ -173,8 +166,7 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             elif endpoint == 'persons':
                 # Get employees as persons
                 try:
-                    employees = models.execute_kw(
-                        ODOO_DB, 2, ODOO_PASSWORD,
+                    employees = odoo.execute_kw(
                         'hr.employee', 'search_read', [],
                         {'fields': ['name', 'barcode', 'work_email', 'department_id']}
                     )
@@ -200,8 +192,7 @@ class OdooAPIHandler(http.server.SimpleHTTPRequestHandler):
             elif endpoint == 'current':
                 # Get current attendance
                 try:
-                    attendance = models.execute_kw(
-                        ODOO_DB, 2, ODOO_PASSWORD,
+                    attendance = odoo.execute_kw(
                         'hr.attendance', 'search_read',
                         [[['check_out', '=', False]]],
                         {'fields': ['employee_id', 'check_in'], 'limit': 50}
@@ -267,7 +258,8 @@ def main():
     # Change to the directory containing this script
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
-    with socketserver.TCPServer(("", FRONTEND_PORT), OdooAPIHandler) as httpd:
+    # One thread per connection, so a slow Odoo call doesn't block other clients
+    with http.server.ThreadingHTTPServer(("", FRONTEND_PORT), OdooAPIHandler) as httpd:
         print(f"✅ Server running on http://localhost:{FRONTEND_PORT}")
         print("📱 Open this URL in your browser to access the frontend")
         print("🔄 The frontend will connect to REAL Odoo data")
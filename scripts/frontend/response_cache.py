@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+In-process response cache for the frontend proxy servers
+Entries expire after a per-key TTL and the least recently used are evicted first
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Maximum number of cached responses
+MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry time-to-live"""
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """Cache value under key for ttl seconds"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *keys):
+        """Drop the given keys, or everything when no key is given"""
+        with self._lock:
+            if not keys:
+                self._entries.clear()
+            for key in keys:
+                self._entries.pop(key, None)
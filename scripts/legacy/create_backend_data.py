@@ -63,29 +63,34 @@ def create_employees_with_types(uid, models):
     
     created_employees = []
     
-    for emp_data in employees_data:
-        try:
-            # Check if employee already exists
-            existing = models.execute_kw(
+    try:
+        # One lookup for the employees that already exist, one create for the others
+        existing = {
+            employee['work_email']: employee['id']
+            for employee in models.execute_kw(
                 ODOO_DB, uid, ADMIN_PASSWORD,
-                'hr.employee', 'search',
-                [[['work_email', '=', emp_data['work_email']]]]
+                'hr.employee', 'search_read',
+                [[['work_email', 'in', [emp_data['work_email'] for emp_data in employees_data]]]],
+                {'fields': ['work_email']}
             )
-            
-            if not existing:
-                emp_id = models.execute_kw(
-                    ODOO_DB, uid, ADMIN_PASSWORD,
-                    'hr.employee', 'create',
-                    [emp_data]
-                )
-                print(f"✅ Created employee: {emp_data['name']} (ID: {emp_id})")
-                created_employees.append(emp_id)
-            else:
+        }
+        missing = [emp_data for emp_data in employees_data if emp_data['work_email'] not in existing]
+        new_ids = models.execute_kw(
+            ODOO_DB, uid, ADMIN_PASSWORD,
+            'hr.employee', 'create',
+            [missing]
+        ) if missing else []
+        
+        for emp_data, emp_id in zip(missing, new_ids):
+            print(f"✅ Created employee: {emp_data['name']} (ID: {emp_id})")
+            existing[emp_data['work_email']] = emp_id
+        for emp_data in employees_data:
+            if emp_data not in missing:
                 print(f"✅ Employee already exists: {emp_data['name']}")
-                created_employees.append(existing[0])
-                
-        except Exception as e:
-            print(f"❌ Failed to create employee {emp_data['name']}: {e}")
+            created_employees.append(existing[emp_data['work_email']])
+            
+    except Exception as e:
+        print(f"❌ Failed to create employees: {e}")
     
     return created_employees
 
@@ -314,18 +314,27 @@ class EmployeeManager:
                 }
             ]
             
-            created_employees = []
-            for emp_data in sample_employees:
-                emp_id = self.create_employee(
-                    name=emp_data['name'],
-                    barcode=emp_data['barcode'],
-                    email=emp_data['email'],
-                    phone=emp_data['phone'],
-                    department_name=emp_data['department_name'],
-                    job_title=emp_data['job_title']
-                )
-                if emp_id:
-                    created_employees.append(emp_id)
+            # Resolve each department and job once, then create all employees in one call
+            department_ids = {name: self.get_or_create_department(name)
+                              for name in {emp_data['department_name'] for emp_data in sample_employees}}
+            job_ids = {title: self.get_or_create_job(title)
+                       for title in {emp_data['job_title'] for emp_data in sample_employees}}
+            
+            employees_data = [{
+                'name': emp_data['name'],
+                'active': True,
+                'employee_type': 'employee',
+                'barcode': emp_data['barcode'],
+                'work_email': emp_data['email'],
+                'work_phone': emp_data['phone'],
+                'department_id': department_ids[emp_data['department_name']] or False,
+                'job_id': job_ids[emp_data['job_title']] or False,
+            } for emp_data in sample_employees]
+            
+            created_employees = self.models.execute_kw(
+                self.db, self.uid, self.password,
+                'hr.employee', 'create', [employees_data]
+            )
             
             print(f"✅ Created {len(created_employees)} sample employees!")
             return created_employees
@@ -4,6 +4,7 @@ Create Dummy Data and Test Hierarchical Attendance Flow
 Creates realistic school personas and tests the hierarchical attendance system
 """
 
+import json
 import xmlrpc.client
 import sys
 import time
@@ -101,27 +102,27 @@ def main():
             }
         ]
         
-        created_persons = {}
+        # One server-side import; existing person IDs are reported and kept as is
+        result = models.execute_kw(
+            ODOO_DB, uid, ODOO_PASSWORD,
+            'extended.attendance.person', 'import_persons',
+            ['\n'.join(json.dumps(person_data) for person_data in dummy_persons), 'ndjson'],
+            {'update_existing': False}
+        )
+        skipped = {error['person_id']: error['error'] for error in result['errors']}
         for person_data in dummy_persons:
-            # Check if person already exists
-            existing = models.execute_kw(
-                ODOO_DB, uid, ODOO_PASSWORD,
-                'extended.attendance.person', 'search',
-                [['person_id', '=', person_data['person_id']]]
-            )
-            
-            if existing:
-                person_id = existing[0]
-                print(f"   🔄 Person {person_data['name']} already exists")
+            if person_data['person_id'] in skipped:
+                print(f"   🔄 Person {person_data['name']}: {skipped[person_data['person_id']]}")
             else:
-                person_id = models.execute_kw(
-                    ODOO_DB, uid, ODOO_PASSWORD,
-                    'extended.attendance.person', 'create',
-                    [person_data]
-                )
                 print(f"   ✅ Created {person_data['name']} ({person_data['person_id']}) - {person_data['role']}")
-            
-            created_persons[person_data['person_id']] = person_id
+        
+        persons = models.execute_kw(
+            ODOO_DB, uid, ODOO_PASSWORD,
+            'extended.attendance.person', 'search_read',
+            [[['person_id', 'in', [person_data['person_id'] for person_data in dummy_persons]]]],
+            {'fields': ['person_id']}
+        )
+        created_persons = {person['person_id']: person['id'] for person in persons}
         
         print(f"\n🎉 Created/verified {len(created_persons)} persons")
         
@@ -31,16 +31,6 @@ def main():
         
         print(f"✅ Authenticated as user ID: {uid}")
         
-        # Get existing locations to avoid duplicates
-        print("🔍 Checking existing locations...")
-        existing_locations = models.execute_kw(
-            ODOO_DB, uid, ODOO_PASSWORD,
-            'attendance.location', 'search_read',
-            [[]], {'fields': ['name', 'code']}
-        )
-        existing_codes = {loc['code']: loc['id'] for loc in existing_locations}
-        print(f"   Found {len(existing_locations)} existing locations")
-        
         # Define hierarchical location structure
         locations_data = [
             # Root level - Main Building
@@ -48,8 +38,7 @@ def main():
                 'name': 'Main Building',
                 'code': 'MAIN_BUILDING',
                 'description': 'Main school building',
-                'sequence': 1,
-                'parent_location_id': None
+                'sequence': 1
             },
             
             # Level 1 - Main areas
@@ -155,51 +144,18 @@ def main():
             },
         ]
         
-        # Create locations in order (parents first)
-        created_locations = {}
-        
-        print("🏗️  Creating hierarchical locations...")
-        for location_data in locations_data:
-            # Handle parent relationship
-            parent_code = location_data.pop('parent_code', None)
-            if parent_code and parent_code in created_locations:
-                location_data['parent_location_id'] = created_locations[parent_code]
-            elif parent_code and parent_code in existing_codes:
-                location_data['parent_location_id'] = existing_codes[parent_code]
-            elif 'parent_location_id' in location_data and location_data['parent_location_id'] is None:
-                # Remove None parent_location_id to avoid marshalling issues
-                del location_data['parent_location_id']
-
-            # Check if location already exists
-            if location_data['code'] in existing_codes:
-                location_id = existing_codes[location_data['code']]
-                # Update existing location with hierarchy info
-                models.execute_kw(
-                    ODOO_DB, uid, ODOO_PASSWORD,
-                    'attendance.location', 'write',
-                    [location_id, location_data]
-                )
-                print(f"   🔄 Updated existing: {location_data['name']} ({location_data['code']})")
-            else:
-                # Create new location
-                location_id = models.execute_kw(
-                    ODOO_DB, uid, ODOO_PASSWORD,
-                    'attendance.location', 'create', [location_data]
-                )
-                print(f"   ✅ Created new: {location_data['name']} ({location_data['code']})")
-
-            created_locations[location_data['code']] = location_id
-            
-            # Get the created location to show hierarchy
-            location = models.execute_kw(
-                ODOO_DB, uid, ODOO_PASSWORD,
-                'attendance.location', 'read',
-                [location_id], {'fields': ['name', 'code']}
-            )[0]
-
-            print(f"   ✅ {location['name']} ({location['code']})")
+        # One server-side import: parents are resolved by code and existing codes updated
+        print("🏗️  Importing hierarchical locations...")
+        result = models.execute_kw(
+            ODOO_DB, uid, ODOO_PASSWORD,
+            'attendance.location', 'import_location_tree',
+            [locations_data]
+        )
+        for error in result['errors']:
+            print(f"   ❌ {error['code']}: {error['error']}")
+        print(f"   ✅ Created {result['created']}, updated {result['updated']} locations")
         
-        print(f"\n🎉 Successfully created {len(created_locations)} hierarchical locations!")
+        print(f"\n🎉 Successfully imported {result['created'] + result['updated']} hierarchical locations!")
         
         # Display the hierarchy
         print("\n📋 Location Hierarchy:")